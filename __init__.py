@@ -30,7 +30,14 @@ from .nodes import (
     MidJourneyAnimateFromImage,
     MidJourneyExtendVideo,
     MidJourneyLoadVideo,
+    MidJourneyLoadVideoFrames,
+    MidJourneyImagineBatch,
+    MidJourneyParamSweep,
+    MidJourneyUpscaleFanout,
+    MidJourneyDownloadBulk,
+    MidJourneyHarvested,
 )
+from .utils import get_harvester, resume_unfinished_jobs
 
 WEB_DIRECTORY = "./web"
 
@@ -44,11 +51,17 @@ _NODES = [
     MidJourneyUpscale,
     MidJourneyPan,
     MidJourneyDownload,
+    MidJourneyImagineBatch,
+    MidJourneyParamSweep,
+    MidJourneyUpscaleFanout,
+    MidJourneyDownloadBulk,
+    MidJourneyHarvested,
     VideoParams,
     MidJourneyAnimate,
     MidJourneyAnimateFromImage,
     MidJourneyExtendVideo,
     MidJourneyLoadVideo,
+    MidJourneyLoadVideoFrames,
     *KEYWORD_NODES,
     MidJourneyKeywordJoin,
     MidJourneyKeywordRandom,
@@ -57,6 +70,21 @@ _NODES = [
 
 
 class MidJourneyExtension(ComfyExtension):
+    @override
+    async def on_load(self) -> None:
+        # 재시작 전 서밋했지만 완료를 확인하지 못한 job의 폴링 재개
+        try:
+            n = resume_unfinished_jobs()
+            if n:
+                print(f"[MJ] 원장에서 미완료 job {n}개의 폴링을 재개합니다")
+        except Exception as e:
+            print(f"[MJ] job 원장 폴링 재개 실패: {e}")
+        # 아직 결과를 받지 않은 enqueue job 수확 (폴링 재개 실패와 무관하게 시작)
+        try:
+            get_harvester().start()
+        except Exception as e:
+            print(f"[MJ] enqueue 수확기 시작 실패: {e}")
+
     @override
     async def get_node_list(self) -> list[type[io.ComfyNode]]:
         return _NODES
@@ -0,0 +1,113 @@
+"""Midjourney 계정 풀 — 여러 .env 자격 증명으로 만든 클라이언트와 계정별 슬롯·fast 시간 예산."""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from dotenv import dotenv_values
+from midjourney_api import MidjourneyClient
+
+from .scheduler import JobScheduler
+
+# 기본(.env) 계정 이름 — account 컬럼이 비어 있는 예전 원장 행도 이 계정으로 간주
+PRIMARY = "default"
+
+# fast 시간을 소모하는 모드와 배율
+_FAST_COST = {"fast": 1.0, "turbo": 2.0}
+
+
+@dataclass
+class Account:
+    """계정 하나. 설정은 계정 .env → 프로세스 환경변수 순으로 찾습니다."""
+
+    name: str
+    env_path: Path
+    settings: dict[str, str]
+    scheduler: JobScheduler | None = None
+    _client: MidjourneyClient | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def setting(self, key: str, default: str | None = None) -> str | None:
+        value = self.settings.get(key)
+        return value if value not in (None, "") else os.environ.get(key, default)
+
+    @property
+    def fast_hours(self) -> float | None:
+        """월간 fast 시간 예산(MJ_FAST_HOURS). 설정이 없으면 None(무제한으로 취급)."""
+        value = self.setting("MJ_FAST_HOURS")
+        return float(value) if value else None
+
+    def client(self) -> MidjourneyClient:
+        with self._lock:
+            if self._client is None:
+                self._client = MidjourneyClient(env_path=str(self.env_path))
+            return self._client
+
+
+class AccountPool:
+    """서밋할 계정을 고르는 풀.
+
+    follow-up(원본 job이 있는 요청)은 원본 job을 가진 계정에 고정되고, 새 요청은
+    해당 모드의 여유 슬롯이 가장 많은 계정 → fast 시간 잔량이 가장 많은 계정 순으로 고릅니다.
+    """
+
+    def __init__(self, accounts: list[Account]):
+        if not accounts:
+            raise ValueError("계정이 하나 이상 필요합니다")
+        self._accounts = {a.name: a for a in accounts}
+        self.primary = accounts[0]
+
+    @classmethod
+    def from_env_files(
+        cls,
+        paths: list[Path],
+        limits: Callable[[Account], dict[str, int]],
+        default_limit: int,
+    ) -> AccountPool:
+        """paths[0]이 기본 계정. limits(account)로 계정별 모드 슬롯 한도를 정합니다."""
+        accounts = []
+        for i, path in enumerate(paths):
+            settings = {k: v for k, v in dotenv_values(path).items() if v is not None}
+            name = PRIMARY if i == 0 else settings.get("MJ_ACCOUNT_NAME") or path.name
+            account = Account(name, path, settings)
+            account.scheduler = JobScheduler(limits(account), default_limit)
+            accounts.append(account)
+        return cls(accounts)
+
+    def __iter__(self):
+        return iter(self._accounts.values())
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def get(self, name: str | None) -> Account:
+        """이름으로 계정을 찾습니다. 모르는 이름·None이면 기본 계정."""
+        return self._accounts.get(name or PRIMARY, self.primary)
+
+    def pick(self, mode: str, fast_seconds_used: Callable[[Account], float]) -> Account:
+        """새 요청을 보낼 계정. fast_seconds_used(account)는 이번 달 사용한 fast 시간(초)."""
+        mode = str(mode)
+        if len(self._accounts) == 1:
+            return self.primary
+
+        def remaining(account: Account) -> float:
+            budget = account.fast_hours
+            if mode not in _FAST_COST or budget is None:
+                return float("inf")
+            return budget * 3600 - fast_seconds_used(account)
+
+        def score(account: Account) -> tuple[bool, int, float]:
+            left = remaining(account)
+            # fast 예산이 바닥난 계정은 모든 계정이 바닥났을 때만 사용
+            return (left > 0, account.scheduler.headroom(mode), left)
+
+        return max(self._accounts.values(), key=score)
+
+
+def fast_cost(mode: str) -> float:
+    """모드별 fast 시간 소모 배율. fast 시간을 쓰지 않는 모드는 0."""
+    return _FAST_COST.get(str(mode), 0.0)
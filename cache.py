@@ -0,0 +1,116 @@
+"""캐시 — 바이트 예산 안의 LRU 파일 저장소와 텐서 메모리 캐시."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Hashable
+
+import torch
+
+_TMP_SUFFIX = ".part"
+
+
+class DiskLRU:
+    """디렉터리 하나를 max_bytes 안에서 LRU로 관리합니다.
+
+    최근 사용 시각은 파일 mtime으로 표시하며(get 시 갱신), 쓰기는 임시 파일 작성 후
+    os.replace로 원자적으로 이뤄집니다. 예산을 넘으면 가장 오래 쓰이지 않은 파일부터 지웁니다.
+    pin()한 파일은 프로세스가 끝날 때까지 지우지 않습니다.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._pinned: set[str] = set()
+
+    def path(self, name: str) -> Path:
+        return self.root / name
+
+    def get(self, name: str) -> Path | None:
+        """캐시된 파일 경로. 없으면 None."""
+        path = self.path(name)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, name: str, write: Callable[[Path], None]) -> Path:
+        """write(임시 경로)로 파일을 만든 뒤 name으로 원자적으로 옮깁니다."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(name)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}{_TMP_SUFFIX}")
+        try:
+            write(tmp)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._evict(keep=path)
+        return path
+
+    def pin(self, name: str) -> None:
+        """name을 축출 대상에서 제외합니다 (다른 곳에 경로가 넘겨져 계속 쓰일 파일)."""
+        with self._lock:
+            self._pinned.add(str(self.path(name)))
+
+    def put_bytes(self, name: str, data: bytes) -> Path:
+        return self.put(name, lambda tmp: tmp.write_bytes(data))
+
+    def _evict(self, keep: Path) -> None:
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.root):
+                if not entry.is_file() or entry.name.endswith(_TMP_SUFFIX):
+                    continue
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+            if total <= self.max_bytes:
+                return
+            for _mtime, size, p in sorted(entries):
+                if p == str(keep) or p in self._pinned:
+                    continue
+                try:
+                    os.remove(p)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+
+class TensorLRU:
+    """디코드된 텐서의 메모리 LRU. 항목 수가 아니라 텐서 바이트 합으로 한도를 둡니다."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items: OrderedDict[Hashable, torch.Tensor] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: Hashable) -> torch.Tensor | None:
+        with self._lock:
+            t = self._items.get(key)
+            if t is not None:
+                self._items.move_to_end(key)
+            return t
+
+    def put(self, key: Hashable, tensor: torch.Tensor) -> None:
+        """tensor를 그대로 보관합니다. 호출자는 다른 텐서와 저장소를 공유하지 않는 텐서를 넘겨야 합니다."""
+        size = tensor.nelement() * tensor.element_size()
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nelement() * old.element_size()
+            self._items[key] = tensor
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= evicted.nelement() * evicted.element_size()
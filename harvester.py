@@ -0,0 +1,86 @@
+"""enqueue job 수확기 — 백그라운드에서 완료된 enqueue job의 결과를 미리 받아 둡니다."""
+
+from __future__ import annotations
+
+import threading
+import time
+import traceback
+from typing import Callable
+
+from midjourney_api.models import Job
+
+from .ledger import COMPLETED, JobLedger
+
+
+class Harvester:
+    """원장에서 enqueue됐지만 아직 수확되지 않은 job을 낮은 빈도로 확인하고, 완료된 job을 harvest합니다.
+
+    check(job_id): 완료됐으면 Job, 진행 중이면 None.
+    harvest(job, row): 결과를 받아 저장(디스크 캐시 등). 성공하면 원장에 harvested_at이 기록됩니다.
+    wake()로 주기를 기다리지 않고 완료 기록된 job을 바로 처리하게 할 수 있습니다.
+    wake가 잦아도 마지막 전체 확인 후 interval이 지나면 미완료 job까지 확인합니다.
+    """
+
+    def __init__(
+        self,
+        ledger: JobLedger,
+        check: Callable[[str], Job | None],
+        harvest: Callable[[Job, dict], None],
+        interval: float = 60,
+        max_age: float = 24 * 3600,
+    ):
+        self._ledger = ledger
+        self._check = check
+        self._harvest = harvest
+        self._interval = interval
+        self._max_age = max_age
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mj-harvester", daemon=True)
+                self._thread.start()
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def harvest_once(self, check_pending: bool = True) -> int:
+        """미수확 job을 한 번 훑습니다. check_pending=False면 원장에 완료로 기록된 job만 처리.
+
+        수확한 job 수를 반환합니다.
+        """
+        count = 0
+        for row in self._ledger.unharvested(self._max_age):
+            if not check_pending and row["status"] != COMPLETED:
+                continue
+            try:
+                job = self._check(row["job_id"])
+                if job is None:
+                    continue
+                self._harvest(job, row)
+            except Exception as e:
+                print(f"[MJ] 수확 실패 job={row['job_id']}: {e}")
+                continue
+            self._ledger.mark_harvested(row["job_id"])
+            count += 1
+        return count
+
+    def _run(self) -> None:
+        last_sweep = time.monotonic()
+        while True:
+            # wake가 다음 전체 확인 시점을 미루지 않도록 남은 시간만 기다림
+            self._wakeup.wait(max(0.0, last_sweep + self._interval - time.monotonic()))
+            self._wakeup.clear()
+            full = time.monotonic() - last_sweep >= self._interval
+            if full:
+                last_sweep = time.monotonic()
+            try:
+                n = self.harvest_once(check_pending=full)
+            except Exception:
+                traceback.print_exc()
+                continue
+            if n:
+                print(f"[MJ] enqueue job {n}개 수확 완료")
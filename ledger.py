@@ -0,0 +1,177 @@
+"""SQLite job 원장 — 서밋한 job을 기록해 ComfyUI 재시작 후에도 결과를 회수할 수 있게 합니다."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# 상태 값
+SUBMITTED = "submitted"
+COMPLETED = "completed"
+TIMEOUT = "timeout"  # 추적 시간 안에 완료를 확인하지 못함 — 아직 실행 중일 수 있어 재사용 대상
+FAILED = "failed"    # 상태 조회가 실패를 확인함
+
+# 컬럼 정의 — 기존 DB에 없는 컬럼은 열 때 ALTER TABLE로 추가됨
+_COLUMNS = {
+    "job_id":       "TEXT PRIMARY KEY",
+    "action":       "TEXT NOT NULL",
+    "source_job":   "TEXT",
+    "source_index": "INTEGER",
+    "prompt":       "TEXT",
+    "params":       "TEXT",
+    "mode":         "TEXT",
+    "status":       "TEXT NOT NULL",
+    "submitted_at": "REAL NOT NULL",
+    "completed_at": "REAL",
+    "submit_key":   "TEXT",
+    "account":      "TEXT",
+    "enqueued":     "INTEGER NOT NULL DEFAULT 0",
+    "harvested_at": "REAL",
+}
+
+
+class JobLedger:
+    """job 하나당 한 행. 여러 스레드에서 공유하므로 모든 접근을 락으로 직렬화합니다."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        cols = ", ".join(f"{name} {decl}" for name, decl in _COLUMNS.items())
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS jobs ({cols})")
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for name, decl in _COLUMNS.items():
+            if name not in existing:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {decl}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, submitted_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_submit_key ON jobs (submit_key)")
+
+    def record_submit(
+        self,
+        job_id: str,
+        action: str,
+        mode: str,
+        prompt: str = "",
+        source_job: str | None = None,
+        source_index: int | None = None,
+        params: dict | None = None,
+        submit_key: str | None = None,
+        account: str | None = None,
+    ) -> None:
+        row = {
+            "job_id": job_id,
+            "action": action,
+            "source_job": source_job,
+            "source_index": source_index,
+            "prompt": prompt,
+            "params": json.dumps(params or {}, ensure_ascii=False, sort_keys=True, default=str),
+            "mode": str(mode),
+            "status": SUBMITTED,
+            "submitted_at": time.time(),
+            "submit_key": submit_key,
+            "account": account,
+        }
+        names = ", ".join(row)
+        marks = ", ".join("?" for _ in row)
+        with self._lock:
+            self._conn.execute(f"INSERT OR REPLACE INTO jobs ({names}) VALUES ({marks})",
+                               tuple(row.values()))
+
+    def mark(self, job_id: str, status: str) -> None:
+        completed_at = time.time() if status == COMPLETED else None
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET status = ?, completed_at = ? WHERE job_id = ?",
+                               (status, completed_at, job_id))
+
+    def mark_enqueued(self, job_id: str) -> None:
+        """enqueue 모드로 반환된 job — 수확기가 결과를 받아 둘 대상."""
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET enqueued = 1 WHERE job_id = ?", (job_id,))
+
+    def mark_harvested(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET harvested_at = ? WHERE job_id = ?", (time.time(), job_id))
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def find_by_key(self, submit_key: str) -> dict | None:
+        """같은 서밋 키로 가장 최근에 서밋된, 실패하지 않은 job. 타임아웃 job도 아직 실행 중일 수 있어 포함."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE submit_key = ? AND status IN (?, ?, ?) "
+                "ORDER BY submitted_at DESC LIMIT 1",
+                (submit_key, SUBMITTED, TIMEOUT, COMPLETED),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def unfinished(self, max_age: float) -> list[dict]:
+        """max_age초 이내에 서밋됐고 아직 완료되지 않은 job (오래된 순)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN (?, ?) AND submitted_at >= ? ORDER BY submitted_at",
+                (SUBMITTED, TIMEOUT, time.time() - max_age),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def busy_seconds(self, account: str, since: float, include_null: bool = False) -> dict[str, float]:
+        """account가 since 이후 완료한 job의 모드별 소요 시간 합(초).
+
+        include_null: account가 기록되지 않은 행(계정 풀 도입 전)도 포함.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT mode, SUM(completed_at - submitted_at) AS seconds FROM jobs "
+                "WHERE status = ? AND submitted_at >= ? AND (account = ? OR (? AND account IS NULL)) "
+                "GROUP BY mode",
+                (COMPLETED, since, account, include_null),
+            ).fetchall()
+        return {row["mode"]: row["seconds"] or 0.0 for row in rows}
+
+    def query(
+        self,
+        actions: tuple[str, ...] | None = None,
+        since: float = 0.0,
+        statuses: tuple[str, ...] = (SUBMITTED, COMPLETED),
+        limit: int = 1000,
+    ) -> list[dict]:
+        """since 이후 서밋된 job 목록 (오래된 순). actions가 주어지면 해당 action만."""
+        sql = f"SELECT * FROM jobs WHERE submitted_at >= ? AND status IN ({', '.join('?' for _ in statuses)})"
+        args: list = [since, *statuses]
+        if actions:
+            sql += f" AND action IN ({', '.join('?' for _ in actions)})"
+            args.extend(actions)
+        sql += " ORDER BY submitted_at LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [dict(r) for r in rows]
+
+    def unharvested(self, max_age: float) -> list[dict]:
+        """max_age초 이내에 enqueue됐고 아직 수확되지 않은 job (오래된 순)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE enqueued = 1 AND harvested_at IS NULL AND submitted_at >= ? "
+                "ORDER BY submitted_at",
+                (time.time() - max_age,),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def harvested(self, since: float) -> list[dict]:
+        """since 이후 수확된 enqueue job (수확 순)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE enqueued = 1 AND harvested_at >= ? ORDER BY harvested_at",
+                (since,),
+            ).fetchall()
+        return [dict(r) for r in rows]
@@ -11,7 +11,15 @@ from .generation import (
     MidJourneyAnimateFromImage,
     MidJourneyExtendVideo,
     MidJourneyLoadVideo,
+    MidJourneyLoadVideoFrames,
 )
+from .batch import (
+    MidJourneyImagineBatch,
+    MidJourneyParamSweep,
+    MidJourneyUpscaleFanout,
+    MidJourneyDownloadBulk,
+)
+from .harvest import MidJourneyHarvested
 from .params import ImagineV7Params, SaveImagineParams, LoadImagineParams, MJ_PARAMS, VideoParams, MJ_VIDEO_PARAMS, MJ_JOB_ID
 from .style import MJ_StyleSelect
 from .keywords import KEYWORD_NODES
@@ -29,6 +37,12 @@ __all__ = [
     "MidJourneyAnimateFromImage",
     "MidJourneyExtendVideo",
     "MidJourneyLoadVideo",
+    "MidJourneyLoadVideoFrames",
+    "MidJourneyImagineBatch",
+    "MidJourneyParamSweep",
+    "MidJourneyUpscaleFanout",
+    "MidJourneyDownloadBulk",
+    "MidJourneyHarvested",
     "ImagineV7Params",
     "SaveImagineParams",
     "LoadImagineParams",
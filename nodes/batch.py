@@ -0,0 +1,391 @@
+"""여러 job을 한 번에 서밋·폴링하는 배치 노드 (V3 스키마)."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+import time
+
+import comfy.model_management
+import comfy.utils
+import torch
+from comfy_api.latest import io, ui
+from midjourney_api.models import Job
+
+from .const import *
+from .params import MJ_JOB_ID, MJ_PARAMS
+from ..utils import (
+    concat_images,
+    download_and_load_images,
+    check_job,
+    get_ledger,
+    log_job,
+    poll_with_progress_async,
+    run_pipelined,
+    submit_job_async,
+    try_download_all,
+    wait_job_async,
+)
+
+
+def _split_lines(text: str) -> list[str]:
+    """줄 단위 목록. 빈 줄과 앞뒤 공백은 제거."""
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+# 스윕 가능한 파라미터와 허용 범위 (ImagineV7Params의 정수 파라미터 min/max와 같음)
+_SWEEP_PARAMS = {
+    "stylize": (0, 1000),
+    "chaos": (0, 100),
+    "weird": (0, 3000),
+    "sw": (0, 1000),
+    "seed": (0, 4294967295),
+}
+
+# 한 번에 서밋할 수 있는 최대 조합 수 — 조합마다 유료 job 1개
+_MAX_COMBOS = 64
+
+
+def _parse_values(text: str, name: str) -> list[int]:
+    """"100, 250, 500" 같은 값 목록 또는 "0-100:25" 같은 범위(끝 포함, 간격 생략 시 1)를 정수 목록으로.
+
+    값은 name 파라미터의 허용 범위 안이어야 하며, 범위 하나가 _MAX_COMBOS개보다 많은 값으로
+    펼쳐지면 펼치기 전에 ValueError를 냅니다.
+    """
+    lo, hi = _SWEEP_PARAMS[name]
+    values: list[int] = []
+    for part in text.replace("\n", ",").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            span, _, step = part.partition(":")
+            start, _, end = span.partition("-")
+            try:
+                start, end, step = int(start), int(end), int(step or 1)
+            except ValueError:
+                raise ValueError(f"--{name} 값을 해석할 수 없습니다: {part!r}") from None
+            if step <= 0 or end < start:
+                raise ValueError(f"잘못된 범위: {part!r} (start-end:step, start <= end, step > 0)")
+            values_in = range(start, end + 1, step)
+            if len(values_in) > _MAX_COMBOS:
+                raise ValueError(f"--{name} 범위 {part!r}는 값 {len(values_in)}개로, "
+                                 f"한 번에 서밋할 수 있는 최대 조합 수({_MAX_COMBOS})를 넘습니다")
+        else:
+            try:
+                start = end = int(part)
+            except ValueError:
+                raise ValueError(f"--{name} 값을 해석할 수 없습니다: {part!r}") from None
+            values_in = [start]
+        if start < lo or end > hi:
+            raise ValueError(f"--{name} 값은 {lo}-{hi} 범위여야 합니다: {part!r}")
+        values.extend(values_in)
+    return list(dict.fromkeys(values))
+
+
+def _format_table(header: list[str], rows: list[list]) -> str:
+    """탭 구분 표 문자열."""
+    return "\n".join("\t".join(str(v) for v in row) for row in [header, *rows])
+
+
+# ---------------------------------------------------------------------------
+# 14. MidJourneyImagineBatch — 여러 프롬프트 일괄 생성
+# ---------------------------------------------------------------------------
+
+class MidJourneyImagineBatch(io.ComfyNode):
+    @classmethod
+    def define_schema(cls):
+        return io.Schema(
+            node_id="MJ_ImagineBatch",
+            display_name="MidJourney Imagine Batch",
+            category="Midjourney",
+            description="여러 프롬프트(한 줄에 하나)를 같은 params로 한 번에 생성합니다. 계정 동시 실행 한도 안에서 겹쳐 서밋하고, 끝나는 job부터 바로 다운로드해 하나의 이미지 배치로 반환합니다.",
+            is_output_node=True,
+            inputs=[
+                io.String.Input("prompts", multiline=True, tooltip="이미지 프롬프트 목록. 한 줄에 하나, 빈 줄은 무시. 같은 줄을 반복하면 그 수만큼 따로 생성"),
+                io.String.Input("no", display_name="Negative", default="",
+                                multiline=True, tooltip="모든 프롬프트에 적용할 네거티브 프롬프트 (--no)"),
+                MJ_PARAMS.Input("params", optional=True),
+            ],
+            outputs=[
+                io.Image.Output(display_name="images"),
+                io.String.Output(display_name="job_ids"),
+            ],
+        )
+
+    @classmethod
+    def execute(cls, prompts, no, params=None) -> io.NodeOutput:
+        kwargs = dict(params) if params else {}
+        mode = kwargs.pop("mode", "fast")
+        if no:
+            kwargs["no"] = no
+
+        lines = _split_lines(prompts)
+        if not lines:
+            raise ValueError("프롬프트가 비어 있습니다")
+        # 같은 줄을 반복하면 그만큼 따로 생성 — 반복 차수를 서밋 키에 넣어 동일 요청 재사용에 합쳐지지 않게 함
+        # (첫 번째 줄은 키가 그대로라 같은 프롬프트의 Imagine 결과를 재사용)
+        seen: dict[str, int] = {}
+        specs = []
+        for p in lines:
+            repeat = seen[p] = seen.get(p, -1) + 1
+            specs.append(dict(action="imagine",
+                              submit=lambda client, p=p: client.imagine(p, wait=False, mode=mode, **kwargs),
+                              mode=mode, prompt=p, params={**kwargs, "repeat": repeat} if repeat else kwargs))
+        results = run_pipelined(specs)
+
+        done = [(p, r) for p, r in zip(lines, results) if r is not None]
+        if not done:
+            raise RuntimeError("모든 프롬프트의 생성에 실패했습니다")
+        for p, (job, _) in done:
+            log_job("ImagineBatch", job.id, prompt=p, mode=mode, **kwargs)
+        print(f"[MJ] ImagineBatch: {len(done)}/{len(lines)}개 완료")
+
+        images = concat_images([images for _, (_, images) in done])
+        job_ids = "\n".join(job.id for _, (job, _) in done)
+        return io.NodeOutput(images, job_ids, ui=ui.PreviewImage(images))
+
+
+# ---------------------------------------------------------------------------
+# 15. MidJourneyParamSweep — 파라미터 그리드 일괄 생성
+# ---------------------------------------------------------------------------
+
+class MidJourneyParamSweep(io.ComfyNode):
+    @classmethod
+    def define_schema(cls):
+        value_tooltip = "값 목록(예: 100, 250, 500) 또는 범위(예: 0-100:25, 끝 포함). 비우면 params 값 그대로"
+        return io.Schema(
+            node_id="MJ_ParamSweep",
+            display_name="MidJourney Param Sweep",
+            category="Midjourney",
+            description=f"같은 프롬프트를 stylize/chaos/weird/sw/seed 값 조합(데카르트 곱, 최대 {_MAX_COMBOS}개)으로 한 번에 생성합니다. 조합들은 겹쳐 서밋되며, 결과는 조합 순서의 이미지 배치(조합당 4장)와 조합별 라벨 표로 반환됩니다.",
+            is_output_node=True,
+            inputs=[
+                io.String.Input("prompt", multiline=True, tooltip="이미지 프롬프트"),
+                io.String.Input("no", display_name="Negative", default="",
+                                multiline=True, tooltip="네거티브 프롬프트 (--no)"),
+                *[io.String.Input(name, default="", tooltip=f"--{name} {value_tooltip}")
+                  for name in _SWEEP_PARAMS],
+                MJ_PARAMS.Input("params", optional=True, tooltip="스윕하지 않는 나머지 파라미터"),
+            ],
+            outputs=[
+                io.Image.Output(display_name="images"),
+                io.String.Output(display_name="labels"),
+                io.String.Output(display_name="job_ids"),
+            ],
+        )
+
+    @classmethod
+    def execute(cls, prompt, no, stylize="", chaos="", weird="", sw="", seed="", params=None) -> io.NodeOutput:
+        base = dict(params) if params else {}
+        mode = base.pop("mode", "fast")
+        if no:
+            base["no"] = no
+
+        axes = {name: _parse_values(text, name) for name, text in
+                zip(_SWEEP_PARAMS, (stylize, chaos, weird, sw, seed)) if text.strip()}
+        if not axes:
+            raise ValueError("스윕할 값이 없습니다. stylize/chaos/weird/sw/seed 중 하나 이상에 값을 입력하세요")
+        names = list(axes)
+        total = math.prod(len(v) for v in axes.values())
+        if total > _MAX_COMBOS:
+            raise ValueError(f"조합이 {total}개({' × '.join(str(len(axes[n])) for n in names)})로, "
+                             f"한 번에 서밋할 수 있는 최대 조합 수({_MAX_COMBOS})를 넘습니다")
+        combos = [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+        print(f"[MJ] ParamSweep: {' × '.join(f'{n}({len(axes[n])})' for n in names)} = {len(combos)}개 조합")
+
+        specs = []
+        for combo in combos:
+            kwargs = {**base, **combo}
+            specs.append(dict(action="imagine",
+                              submit=lambda client, kw=kwargs: client.imagine(prompt, wait=False, mode=mode, **kw),
+                              mode=mode, prompt=prompt, params=kwargs))
+        results = run_pipelined(specs)
+
+        rows, images, job_ids = [], [], []
+        for combo, result in zip(combos, results):
+            if result is None:
+                rows.append(["-", "failed", *combo.values()])
+                continue
+            job, batch = result
+            log_job("ParamSweep", job.id, prompt=prompt, mode=mode, **combo)
+            rows.append([f"{len(images) * 4}-{len(images) * 4 + 3}", job.id, *combo.values()])
+            images.append(batch)
+            job_ids.append(job.id)
+        if not images:
+            raise RuntimeError("모든 조합의 생성에 실패했습니다")
+
+        images = concat_images(images)
+        labels = _format_table(["batch", "job_id", *names], rows)
+        return io.NodeOutput(images, labels, "\n".join(job_ids), ui=ui.PreviewImage(images))
+
+
+# ---------------------------------------------------------------------------
+# 16. MidJourneyUpscaleFanout — 부모 job 완료 즉시 여러 장 업스케일
+# ---------------------------------------------------------------------------
+
+def _parse_indices(text: str) -> list[int]:
+    """"0,1,3" 형식의 이미지 인덱스 목록 (0-3, 중복 제거, 입력 순서 유지)."""
+    indices = [int(part) for part in text.replace(" ", "").split(",") if part]
+    if not indices or any(i not in range(4) for i in indices):
+        raise ValueError(f"indices는 0-3 사이 인덱스를 쉼표로 구분해 입력하세요: {text!r}")
+    return list(dict.fromkeys(indices))
+
+
+class MidJourneyUpscaleFanout(io.ComfyNode):
+    @classmethod
+    def define_schema(cls):
+        return io.Schema(
+            node_id="MJ_UpscaleFanout",
+            display_name="MidJourney Upscale Fan-out",
+            category="Midjourney",
+            description="부모 그리드 job이 완료되는 즉시(이미지 다운로드 전) 선택한 인덱스들의 업스케일을 한꺼번에 서밋하고, 함께 폴링해 끝나는 대로 하나의 이미지 배치로 반환합니다. 부모 Imagine의 enqueue를 켜면 부모 이미지를 받지 않고 바로 이어집니다.",
+            is_output_node=True,
+            inputs=[
+                MJ_JOB_ID.Input("job_id", tooltip="부모(그리드) Job ID. 아직 진행 중이어도 됨"),
+                io.String.Input("indices", default="0,1,2,3",
+                                tooltip="업스케일할 이미지 인덱스 (0-3, 쉼표 구분)"),
+                io.Combo.Input("upscale_type", options=list(UpscaleType), default=UpscaleType.SUBTLE,
+                               tooltip="업스케일 방식. subtle: 원본 유지 / creative: 디테일 재해석"),
+                io.Combo.Input("mode", options=list(SpeedMode), default=SpeedMode.FAST,
+                               tooltip="생성 속도 모드. fast/relax/turbo"),
+            ],
+            outputs=[
+                io.Image.Output(display_name="images"),
+                io.String.Output(display_name="job_ids"),
+            ],
+        )
+
+    @classmethod
+    async def execute(cls, job_id, indices, upscale_type, mode) -> io.NodeOutput:
+        order = _parse_indices(indices)
+
+        # 부모 job 완료 대기 — 원장에 기록이 있으면 그 action/mode로 ETA 추정
+        row = get_ledger().get(job_id)
+        parent = Job(id=job_id, prompt=(row["prompt"] or "") if row else "")
+        await poll_with_progress_async(parent, row["action"] if row else "imagine",
+                                       mode=row["mode"] if row else mode)
+
+        pbar = comfy.utils.ProgressBar(len(order))
+
+        async def upscale(index: int) -> tuple[Job, torch.Tensor] | None:
+            try:
+                job = await submit_job_async(
+                    "upscale",
+                    lambda client: client.upscale(job_id, index, upscale_type=upscale_type, wait=False, mode=mode),
+                    mode, source=job_id, index=index, params={"type": upscale_type})
+                log_job("UpscaleFanout", job.id, mode=mode, source=job_id, index=index, type=upscale_type)
+                job = await wait_job_async(job, "upscale", mode)
+                images = await asyncio.to_thread(download_and_load_images, job, indices=[0])
+            except comfy.model_management.InterruptProcessingException:
+                raise
+            except Exception as e:
+                print(f"[MJ] UpscaleFanout #{index} 실패: {e}")
+                return None
+            pbar.update(1)
+            return job, images
+
+        results = await asyncio.gather(*(upscale(i) for i in order))
+        done = [r for r in results if r is not None]
+        if not done:
+            raise RuntimeError("모든 업스케일에 실패했습니다")
+
+        images = concat_images([images for _, images in done])
+        return io.NodeOutput(images, "\n".join(job.id for job, _ in done), ui=ui.PreviewImage(images))
+
+
+# ---------------------------------------------------------------------------
+# 17. MidJourneyDownloadBulk — 여러 job 결과 일괄 다운로드
+# ---------------------------------------------------------------------------
+
+# 이미지 결과를 내는 action (비디오 job은 일괄 다운로드 대상에서 제외)
+_IMAGE_ACTIONS = ("imagine", "vary", "remix", "pan", "upscale")
+
+# 동시에 처리하는 job 수
+_BULK_CONCURRENCY = 8
+
+
+class MidJourneyDownloadBulk(io.ComfyNode):
+    @classmethod
+    def define_schema(cls):
+        return io.Schema(
+            node_id="MJ_DownloadBulk",
+            display_name="MidJourney Download Bulk",
+            category="Midjourney",
+            description="여러 job의 이미지를 동시에 받아 하나의 이미지 배치와 인덱스 표로 반환합니다. job_ids가 비어 있으면 job 원장에서 최근 since_hours 시간 안에 서밋한 job을 조회합니다. 아직 진행 중인 job은 건너뜁니다.",
+            is_output_node=True,
+            inputs=[
+                io.String.Input("job_ids", default="", multiline=True,
+                                tooltip="Job ID 목록 (한 줄에 하나 또는 쉼표 구분). 비우면 원장 조회"),
+                io.Int.Input("since_hours", default=24, min=1, max=24 * 90,
+                             tooltip="원장 조회 시: 최근 N시간 안에 서밋한 job"),
+                io.Combo.Input("action", options=["all", *_IMAGE_ACTIONS], default="all",
+                               tooltip="원장 조회 시: 해당 action의 job만"),
+                io.Int.Input("limit", default=200, min=1, max=5000,
+                             tooltip="원장 조회 시: 최대 job 수 (오래된 순)"),
+            ],
+            outputs=[
+                io.Image.Output(display_name="images"),
+                io.String.Output(display_name="index"),
+                io.String.Output(display_name="job_ids"),
+            ],
+        )
+
+    @classmethod
+    async def execute(cls, job_ids, since_hours, action, limit) -> io.NodeOutput:
+        ledger = get_ledger()
+        ids = _split_lines(job_ids.replace(",", "\n"))
+        if ids:
+            targets = [(i, (ledger.get(i) or {}).get("action")) for i in dict.fromkeys(ids)]
+        else:
+            actions = _IMAGE_ACTIONS if action == "all" else (action,)
+            rows = ledger.query(actions, since=time.time() - since_hours * 3600, limit=limit)
+            targets = [(r["job_id"], r["action"]) for r in rows]
+        if not targets:
+            raise ValueError("다운로드할 job이 없습니다")
+
+        sem = asyncio.Semaphore(_BULK_CONCURRENCY)
+        pbar = comfy.utils.ProgressBar(len(targets))
+
+        async def fetch(job_id: str, job_action: str | None) -> tuple[str, list[int], torch.Tensor | None]:
+            if job_action is not None and job_action not in _IMAGE_ACTIONS:
+                pbar.update(1)
+                return "skipped (video)", [], None
+            async with sem:
+                try:
+                    job = await asyncio.to_thread(check_job, job_id)
+                    if job is None:
+                        return "pending", [], None
+                    if job_action == "upscale":
+                        return "ok", [0], await asyncio.to_thread(download_and_load_images, job, indices=[0])
+                    results = await asyncio.to_thread(try_download_all, job)
+                    found = [i for i, r in enumerate(results) if r is not None]
+                    return "ok", found, torch.cat([results[i] for i in found], dim=0)
+                except comfy.model_management.InterruptProcessingException:
+                    raise
+                except Exception as e:
+                    return f"failed ({e})", [], None
+                finally:
+                    pbar.update(1)
+
+        results = await asyncio.gather(*(fetch(job_id, a) for job_id, a in targets))
+
+        rows, batches, done_ids = [], [], []
+        offset = 0
+        for (job_id, _), (status, found, images) in zip(targets, results):
+            if images is None:
+                rows.append(["-", job_id, status, ""])
+                continue
+            rows.append([f"{offset}-{offset + len(images) - 1}", job_id, status, ",".join(map(str, found))])
+            offset += len(images)
+            batches.append(images)
+            done_ids.append(job_id)
+        pending = sum(1 for status, _, _ in results if status == "pending")
+        print(f"[MJ] DownloadBulk: {len(done_ids)}/{len(targets)}개 다운로드, 진행 중 {pending}개 건너뜀")
+        if not batches:
+            raise RuntimeError(f"다운로드할 수 있는 완료된 job이 없습니다 (진행 중 {pending}개)")
+
+        images = concat_images(batches)
+        index = _format_table(["batch", "job_id", "status", "indices"], rows)
+        return io.NodeOutput(images, index, "\n".join(done_ids), ui=ui.PreviewImage(images))
@@ -31,6 +31,12 @@ class MotionIntensity(StrEnum):
     HIGH = "high"
 
 
+class DownloadMode(StrEnum):
+    """images: 이미지별 개별 요청 / grid: 그리드 1장을 받아 4분할."""
+    IMAGES = "images"
+    GRID   = "grid"
+
+
 QUALITY_OPTIONS    = [str(v) for v in Quality._allowed]       # ["1", "2", "4"]
 VISIBILITY_OPTIONS = ["default"] + list(VisibilityMode)        # ["default", "stealth", "public"]
 SV_OPTIONS         = [str(v) for v in StyleVersion._allowed]   # ["4", "6", "7", "8"] (스타일 버전 옵션)
@@ -44,6 +50,7 @@ __all__ = [
     "PersonalizeMode",
     "VideoResolution",
     "MotionIntensity",
+    "DownloadMode",
     # 파생 옵션 목록
     "QUALITY_OPTIONS",
     "VISIBILITY_OPTIONS",
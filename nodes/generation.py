@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import torch
 from comfy_api.latest import io, ui
 from comfy_execution.graph import ExecutionBlocker
 
 from .const import *
+from .graph import consumer_types, consumers, running_item
 from .params import MJ_JOB_ID, MJ_PARAMS, MJ_VIDEO_PARAMS
+from .planner import imagine_request, note_executed, plan_prompt
 from ..utils import (
+    decode_video_frames,
     download_and_load_images,
-    get_client,
-    image_tensor_to_temp_file,
+    download_grid_images,
+    download_video_file,
+    image_tensor_to_file,
     log_job,
-    poll_with_progress,
+    mark_enqueued,
+    poll_with_progress_async,
+    submission_cache_enabled,
+    submit_job_async,
     try_download_all,
-    video_bytes_to_video_input,
+    video_file_to_video_input,
 )
 
 
@@ -32,22 +41,12 @@ _MJ_JOB_SUBMIT_NODE_IDS = {
 
 def _image_connected(unique_id: str, prompt: dict, image_indices: frozenset) -> bool:
     """지정된 Image 출력 슬롯 중 하나라도 어떤 노드에든 연결되어 있으면 True."""
-    for node in prompt.values():
-        for link in node.get("inputs", {}).values():
-            if isinstance(link, list) and link[0] == unique_id and link[1] in image_indices:
-                return True
-    return False
+    return any(consumers(prompt, unique_id, i) for i in image_indices)
 
 
 def _job_id_to_mj(unique_id: str, prompt: dict, job_id_idx: int) -> bool:
     """job_id 출력(job_id_idx)이 MJ 잡 서밋 노드에 연결되어 있으면 True."""
-    for node in prompt.values():
-        if node.get("class_type") not in _MJ_JOB_SUBMIT_NODE_IDS:
-            continue
-        for link in node.get("inputs", {}).values():
-            if isinstance(link, list) and link[0] == unique_id and link[1] == job_id_idx:
-                return True
-    return False
+    return not consumer_types(prompt, unique_id, job_id_idx).isdisjoint(_MJ_JOB_SUBMIT_NODE_IDS)
 
 
 def _should_override_enqueue(unique_id, prompt, image_indices, job_id_idx) -> bool:
@@ -58,14 +57,82 @@ def _should_override_enqueue(unique_id, prompt, image_indices, job_id_idx) -> bo
     )
 
 
+# 일부 슬롯만 받을 때 미리보기용 저해상도 크기
+_PREVIEW_SIZE = 384
+
+
+def _current_prompt(cls) -> dict | None:
+    """실행 중인 prompt. fingerprint 단계에서는 hidden.prompt가 비어 있으므로 실행 큐에서 찾습니다."""
+    if cls.hidden is not None and cls.hidden.prompt:
+        return cls.hidden.prompt
+    item = running_item(cls.hidden.unique_id) if cls.hidden is not None else None
+    return item[2] if item else None
+
+
+def _connected_image_slots(unique_id: str, prompt: dict | None, n: int) -> tuple[int, ...]:
+    """어떤 노드에든 연결된 Image 출력 슬롯 인덱스. prompt 정보가 없으면 전체 슬롯."""
+    if not prompt:
+        return tuple(range(n))
+    return tuple(i for i in range(n) if _image_connected(unique_id, prompt, frozenset({i})))
+
+
+def _image_slots(cls, n: int = 4) -> tuple[int, ...]:
+    """다운로드할 Image 슬롯. 동일 요청 재사용이 꺼져 있으면 재실행이 새 잡이 되므로 항상 전체.
+
+    연결된 슬롯만 받으면 나머지는 ExecutionBlocker로 캐시되므로, 슬롯 연결이 바뀌었을 때
+    fingerprint가 재실행을 일으킬 수 있어야 합니다. fingerprint는 실행 큐의 내부 레이아웃으로 prompt를
+    찾는데(running_item), 그 조회가 실패하는 환경에서는 연결 변경을 감지할 수 없으므로 전체 슬롯을 받습니다.
+    """
+    if not submission_cache_enabled() or running_item(cls.hidden.unique_id) is None:
+        return tuple(range(n))
+    return _connected_image_slots(cls.hidden.unique_id, cls.hidden.prompt, n)
+
+
+def _image_slots_fingerprint(cls, n: int = 4):
+    """연결된 Image 슬롯이 바뀌면 캐시된 출력(ExecutionBlocker 포함)을 쓰지 않고 재실행하도록 합니다."""
+    if not submission_cache_enabled():
+        return None
+    prompt = _current_prompt(cls)
+    return _connected_image_slots(cls.hidden.unique_id, prompt, n) if prompt else None
+
+
+def _download_four(job, download: str, slots: tuple[int, ...]) -> tuple[list, torch.Tensor | None]:
+    """이미지 4장 출력과 미리보기 텐서. slots에 없는 출력은 ExecutionBlocker로 차단합니다.
+
+    grid 모드는 그리드 1장을 잘라 쓰고, 그리드가 없으면 개별 다운로드합니다.
+    일부 슬롯만 받을 때 미리보기는 저해상도 4장으로 대체합니다.
+    """
+    if download == DownloadMode.GRID:
+        grid = download_grid_images(job)
+        if grid is not None:
+            views, preview = grid
+            return [v if i in slots else ExecutionBlocker(None) for i, v in enumerate(views)], preview
+    if len(slots) == 4:
+        images = download_and_load_images(job)
+        return [images[i:i + 1] for i in range(4)], images
+
+    outputs: list = [ExecutionBlocker(None)] * 4
+    images = download_and_load_images(job, indices=list(slots)) if slots else None
+    for pos, i in enumerate(slots):
+        outputs[i] = images[pos:pos + 1]
+    try:
+        preview = download_and_load_images(job, size=_PREVIEW_SIZE)
+    except Exception as e:
+        print(f"[MJ] 저해상도 미리보기 다운로드 실패: {e}")
+        preview = images
+    return outputs, preview
+
+
 def _enqueue_image_outputs(job, n: int = 4) -> io.NodeOutput:
     """enqueue=True일 때: 이미지 n개를 ExecutionBlocker로 차단하고 job_id만 반환."""
+    mark_enqueued(job.id)
     blockers = [ExecutionBlocker(None)] * n
     return io.NodeOutput(*blockers, job.id)
 
 
 def _enqueue_video_output(job) -> io.NodeOutput:
     """enqueue=True일 때: 비디오 노드용 — job_id만 즉시 반환."""
+    mark_enqueued(job.id)
     return io.NodeOutput(job.id)
 
 
@@ -89,6 +156,9 @@ class MidJourneyImagine(io.ComfyNode):
                 MJ_PARAMS.Input("params", optional=True),
                 io.Boolean.Input("enqueue", default=False,
                                  tooltip="True: 잡 서밋 후 즉시 반환 (폴링 없음). job_id로 나중에 MJ_Download"),
+                io.Combo.Input("download", options=list(DownloadMode), default=DownloadMode.IMAGES,
+                               optional=True,
+                               tooltip="결과 다운로드 방식. images: 이미지 4장 개별 요청 / grid: 그리드 1장만 받아 4분할 (없으면 개별 요청)"),
             ],
             outputs=[
                 io.Image.Output(display_name="image_0"),
@@ -101,16 +171,16 @@ class MidJourneyImagine(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, prompt, no, params=None, enqueue=False) -> io.NodeOutput:
-        client = get_client()
-
-        kwargs = dict(params) if params else {}
-        mode = kwargs.pop("mode", "fast")
+    def fingerprint_inputs(cls, **kwargs):
+        return _image_slots_fingerprint(cls)
 
-        if no:
-            kwargs["no"] = no
-
-        job = client.imagine(prompt, wait=False, mode=mode, **kwargs)
+    @classmethod
+    async def execute(cls, prompt, no, params=None, enqueue=False, download=DownloadMode.IMAGES) -> io.NodeOutput:
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
+        request = imagine_request(prompt, no, params)
+        note_executed(cls.hidden.unique_id, request)
+        mode, kwargs = request["mode"], request["params"]
+        job = await submit_job_async(**request)
         log_job("Imagine", job.id, prompt=prompt, mode=mode, **kwargs)
         if enqueue and cls.hidden.prompt and _should_override_enqueue(
                 cls.hidden.unique_id, cls.hidden.prompt, frozenset({0,1,2,3}), 4):
@@ -118,10 +188,9 @@ class MidJourneyImagine(io.ComfyNode):
             enqueue = False
         if enqueue:
             return _enqueue_image_outputs(job, n=4)
-        job = poll_with_progress(job, mode=mode)
-        images = download_and_load_images(job)
-        return io.NodeOutput(images[0:1], images[1:2], images[2:3], images[3:4], job.id,
-                             ui=_preview_ui(images))
+        job = await poll_with_progress_async(job, "imagine", mode=mode)
+        images, preview = await asyncio.to_thread(_download_four, job, download, _image_slots(cls))
+        return io.NodeOutput(*images, job.id, ui=_preview_ui(preview) if preview is not None else None)
 
 
 # ---------------------------------------------------------------------------
@@ -147,6 +216,9 @@ class MidJourneyVary(io.ComfyNode):
                                tooltip="생성 속도 모드. fast/relax/turbo"),
                 io.Boolean.Input("enqueue", default=False,
                                  tooltip="True: 잡 서밋 후 즉시 반환. job_id로 나중에 MJ_Download"),
+                io.Combo.Input("download", options=list(DownloadMode), default=DownloadMode.IMAGES,
+                               optional=True,
+                               tooltip="결과 다운로드 방식. images: 이미지 4장 개별 요청 / grid: 그리드 1장만 받아 4분할 (없으면 개별 요청)"),
             ],
             outputs=[
                 io.Image.Output(display_name="image_0"),
@@ -159,10 +231,16 @@ class MidJourneyVary(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id, index, strong, mode, enqueue=False) -> io.NodeOutput:
-        client = get_client()
+    def fingerprint_inputs(cls, **kwargs):
+        return _image_slots_fingerprint(cls)
+
+    @classmethod
+    async def execute(cls, job_id, index, strong, mode, enqueue=False, download=DownloadMode.IMAGES) -> io.NodeOutput:
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
         label = "Strong" if strong else "Subtle"
-        job = client.vary(job_id, index, strong=strong, wait=False, mode=mode)
+        job = await submit_job_async("vary", lambda client: client.vary(job_id, index, strong=strong, wait=False,
+                                                                        mode=mode),
+                                     mode, source=job_id, index=index, params={"strong": strong})
         log_job(f"Vary ({label})", job.id, mode=mode, source=job_id, index=index)
         if enqueue and cls.hidden.prompt and _should_override_enqueue(
                 cls.hidden.unique_id, cls.hidden.prompt, frozenset({0,1,2,3}), 4):
@@ -170,10 +248,9 @@ class MidJourneyVary(io.ComfyNode):
             enqueue = False
         if enqueue:
             return _enqueue_image_outputs(job, n=4)
-        job = poll_with_progress(job, mode=mode)
-        images = download_and_load_images(job)
-        return io.NodeOutput(images[0:1], images[1:2], images[2:3], images[3:4], job.id,
-                             ui=_preview_ui(images))
+        job = await poll_with_progress_async(job, "vary", mode=mode)
+        images, preview = await asyncio.to_thread(_download_four, job, download, _image_slots(cls))
+        return io.NodeOutput(*images, job.id, ui=_preview_ui(preview) if preview is not None else None)
 
 
 # ---------------------------------------------------------------------------
@@ -201,6 +278,9 @@ class MidJourneyRemix(io.ComfyNode):
                 MJ_PARAMS.Input("params", optional=True),
                 io.Boolean.Input("enqueue", default=False,
                                  tooltip="True: 잡 서밋 후 즉시 반환. job_id로 나중에 MJ_Download"),
+                io.Combo.Input("download", options=list(DownloadMode), default=DownloadMode.IMAGES,
+                               optional=True,
+                               tooltip="결과 다운로드 방식. images: 이미지 4장 개별 요청 / grid: 그리드 1장만 받아 4분할 (없으면 개별 요청)"),
             ],
             outputs=[
                 io.Image.Output(display_name="image_0"),
@@ -213,16 +293,23 @@ class MidJourneyRemix(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id, index, prompt, no, strong, params=None, enqueue=False) -> io.NodeOutput:
-        client = get_client()
+    def fingerprint_inputs(cls, **kwargs):
+        return _image_slots_fingerprint(cls)
+
+    @classmethod
+    async def execute(cls, job_id, index, prompt, no, strong, params=None, enqueue=False,
+                download=DownloadMode.IMAGES) -> io.NodeOutput:
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
         kwargs = dict(params) if params else {}
         mode = kwargs.pop("mode", SpeedMode.FAST)
         stealth = kwargs.pop("visibility", None) == "stealth"
         if no:
             kwargs["no"] = no
         label = "Strong" if strong else "Subtle"
-        job = client.remix(job_id, index, prompt,
-                           strong=strong, wait=False, mode=mode, stealth=stealth, **kwargs)
+        job = await submit_job_async("remix", lambda client: client.remix(job_id, index, prompt, strong=strong, wait=False,
+                                                                          mode=mode, stealth=stealth, **kwargs),
+                                     mode, prompt=prompt, source=job_id, index=index,
+                                     params={**kwargs, "strong": strong, "stealth": stealth})
         log_job(f"Remix ({label})", job.id, prompt=prompt, mode=mode, source=job_id, index=index, **kwargs)
         if enqueue and cls.hidden.prompt and _should_override_enqueue(
                 cls.hidden.unique_id, cls.hidden.prompt, frozenset({0,1,2,3}), 4):
@@ -230,10 +317,9 @@ class MidJourneyRemix(io.ComfyNode):
             enqueue = False
         if enqueue:
             return _enqueue_image_outputs(job, n=4)
-        job = poll_with_progress(job, mode=mode)
-        images = download_and_load_images(job)
-        return io.NodeOutput(images[0:1], images[1:2], images[2:3], images[3:4], job.id,
-                             ui=_preview_ui(images))
+        job = await poll_with_progress_async(job, "remix", mode=mode)
+        images, preview = await asyncio.to_thread(_download_four, job, download, _image_slots(cls))
+        return io.NodeOutput(*images, job.id, ui=_preview_ui(preview) if preview is not None else None)
 
 
 # ---------------------------------------------------------------------------
@@ -270,9 +356,11 @@ class MidJourneyUpscale(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id, index, upscale_type, mode, enqueue=False) -> io.NodeOutput:
-        client = get_client()
-        job = client.upscale(job_id, index, upscale_type=upscale_type, wait=False, mode=mode)
+    async def execute(cls, job_id, index, upscale_type, mode, enqueue=False) -> io.NodeOutput:
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
+        job = await submit_job_async("upscale", lambda client: client.upscale(job_id, index, upscale_type=upscale_type,
+                                                                              wait=False, mode=mode),
+                                     mode, source=job_id, index=index, params={"type": upscale_type})
         log_job("Upscale", job.id, mode=mode, source=job_id, index=index, type=upscale_type)
         if enqueue and cls.hidden.prompt and _should_override_enqueue(
                 cls.hidden.unique_id, cls.hidden.prompt, frozenset({0}), 1):
@@ -280,8 +368,8 @@ class MidJourneyUpscale(io.ComfyNode):
             enqueue = False
         if enqueue:
             return _enqueue_image_outputs(job, n=1)
-        job = poll_with_progress(job, mode=mode)
-        images = download_and_load_images(job, indices=[0])
+        job = await poll_with_progress_async(job, "upscale", mode=mode)
+        images = await asyncio.to_thread(download_and_load_images, job, indices=[0])
         return io.NodeOutput(images, job.id,
                              ui=_preview_ui(images))
 
@@ -315,6 +403,9 @@ class MidJourneyPan(io.ComfyNode):
                                tooltip="생성 속도 모드. fast/relax/turbo"),
                 io.Boolean.Input("enqueue", default=False,
                                  tooltip="True: 잡 서밋 후 즉시 반환. job_id로 나중에 MJ_Download"),
+                io.Combo.Input("download", options=list(DownloadMode), default=DownloadMode.IMAGES,
+                               optional=True,
+                               tooltip="결과 다운로드 방식. images: 이미지 4장 개별 요청 / grid: 그리드 1장만 받아 4분할 (없으면 개별 요청)"),
             ],
             outputs=[
                 io.Image.Output(display_name="image_0"),
@@ -327,9 +418,17 @@ class MidJourneyPan(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id, index, direction, prompt="", no="", mode=SpeedMode.FAST, enqueue=False) -> io.NodeOutput:
-        client = get_client()
-        job = client.pan(job_id, index, direction=direction, prompt=_build_prompt(prompt, no), wait=False, mode=mode)
+    def fingerprint_inputs(cls, **kwargs):
+        return _image_slots_fingerprint(cls)
+
+    @classmethod
+    async def execute(cls, job_id, index, direction, prompt="", no="", mode=SpeedMode.FAST, enqueue=False,
+                download=DownloadMode.IMAGES) -> io.NodeOutput:
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
+        full_prompt = _build_prompt(prompt, no)
+        job = await submit_job_async("pan", lambda client: client.pan(job_id, index, direction=direction, prompt=full_prompt,
+                                                                      wait=False, mode=mode),
+                                     mode, prompt=full_prompt, source=job_id, index=index, params={"direction": direction})
         log_job(f"Pan ({direction})", job.id, prompt=prompt, mode=mode, source=job_id, index=index)
         if enqueue and cls.hidden.prompt and _should_override_enqueue(
                 cls.hidden.unique_id, cls.hidden.prompt, frozenset({0,1,2,3}), 4):
@@ -337,10 +436,9 @@ class MidJourneyPan(io.ComfyNode):
             enqueue = False
         if enqueue:
             return _enqueue_image_outputs(job, n=4)
-        job = poll_with_progress(job, mode=mode)
-        images = download_and_load_images(job)
-        return io.NodeOutput(images[0:1], images[1:2], images[2:3], images[3:4], job.id,
-                             ui=_preview_ui(images))
+        job = await poll_with_progress_async(job, "pan", mode=mode)
+        images, preview = await asyncio.to_thread(_download_four, job, download, _image_slots(cls))
+        return io.NodeOutput(*images, job.id, ui=_preview_ui(preview) if preview is not None else None)
 
 
 # ---------------------------------------------------------------------------
@@ -367,11 +465,11 @@ class MidJourneyDownload(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id) -> io.NodeOutput:
+    async def execute(cls, job_id) -> io.NodeOutput:
         from midjourney_api.models import Job
         job = Job(id=job_id, prompt="")
         job.image_urls = [job.cdn_url(i) for i in range(4)]
-        results = try_download_all(job)
+        results = await asyncio.to_thread(try_download_all, job)
         valid = [r for r in results if r is not None]
         preview = torch.cat(valid, dim=0) if valid else None
         outputs = [
@@ -438,17 +536,20 @@ class MidJourneyAnimate(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id, index, video_params=None, prompt="", no="", enqueue=False) -> io.NodeOutput:
-        client = get_client()
+    async def execute(cls, job_id, index, video_params=None, prompt="", no="", enqueue=False) -> io.NodeOutput:
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
         kw = _video_kwargs(video_params)
-        job = client.animate(job_id, index, prompt=_build_prompt(prompt, no), wait=False, **kw)
+        full_prompt = _build_prompt(prompt, no)
+        job = await submit_job_async("animate", lambda client: client.animate(job_id, index, prompt=full_prompt,
+                                                                              wait=False, **kw),
+                                     kw["mode"], prompt=full_prompt, source=job_id, index=index, params=kw)
         log_job("Animate", job.id, source=job_id, index=index, **kw)
         if enqueue and cls.hidden.prompt and _job_id_to_mj(cls.hidden.unique_id, cls.hidden.prompt, 0):
             print("[MJ] Animate: enqueue 무시 — job_id가 MJ 잡 서밋 노드에 연결됨")
             enqueue = False
         if enqueue:
             return _enqueue_video_output(job)
-        job = poll_with_progress(job, mode=kw["mode"])
+        job = await poll_with_progress_async(job, "animate", mode=kw["mode"])
         return io.NodeOutput(job.id)
 
 
@@ -484,26 +585,29 @@ class MidJourneyAnimateFromImage(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, start_image, end_image=None, loop=False, video_params=None,
+    async def execute(cls, start_image, end_image=None, loop=False, video_params=None,
                 prompt="", no="", enqueue=False) -> io.NodeOutput:
-        client = get_client()
-        start_path = image_tensor_to_temp_file(start_image)
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
+        start_path = image_tensor_to_file(start_image)
         if loop:
             end_path = "loop"
         elif end_image is not None:
-            end_path = image_tensor_to_temp_file(end_image)
+            end_path = image_tensor_to_file(end_image)
         else:
             end_path = None
         kw = _video_kwargs(video_params)
-        job = client.animate_from_image(start_path, end_path, prompt=_build_prompt(prompt, no),
-                                        wait=False, **kw)
+        full_prompt = _build_prompt(prompt, no)
+        job = await submit_job_async("animate", lambda client: client.animate_from_image(start_path, end_path, prompt=full_prompt,
+                                                                                         wait=False, **kw),
+                                     kw["mode"], prompt=full_prompt,
+                                     params={**kw, "start_image": start_path, "end_image": end_path})
         log_job("AnimateFromImage", job.id, **kw)
         if enqueue and cls.hidden.prompt and _job_id_to_mj(cls.hidden.unique_id, cls.hidden.prompt, 0):
             print("[MJ] AnimateFromImage: enqueue 무시 — job_id가 MJ 잡 서밋 노드에 연결됨")
             enqueue = False
         if enqueue:
             return _enqueue_video_output(job)
-        job = poll_with_progress(job, mode=kw["mode"])
+        job = await poll_with_progress_async(job, "animate", mode=kw["mode"])
         return io.NodeOutput(job.id)
 
 
@@ -541,30 +645,33 @@ class MidJourneyExtendVideo(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id, index, loop=False, video_params=None,
+    async def execute(cls, job_id, index, loop=False, video_params=None,
                 end_image=None, prompt="", no="", enqueue=False) -> io.NodeOutput:
-        client = get_client()
+        plan_prompt(cls.hidden.prompt, cls.hidden.unique_id)
         if loop:
             end_path = "loop"
         elif end_image is not None:
-            end_path = image_tensor_to_temp_file(end_image)
+            end_path = image_tensor_to_file(end_image)
         else:
             end_path = None
         kw = _video_kwargs(video_params)
-        job = client.extend_video(job_id, index, end_image=end_path,
-                                  prompt=_build_prompt(prompt, no), wait=False, **kw)
+        full_prompt = _build_prompt(prompt, no)
+        job = await submit_job_async("extend_video", lambda client: client.extend_video(job_id, index, end_image=end_path,
+                                                                                        prompt=full_prompt, wait=False, **kw),
+                                     kw["mode"], prompt=full_prompt, source=job_id, index=index,
+                                     params={**kw, "end_image": end_path})
         log_job("ExtendVideo", job.id, source=job_id, index=index, **kw)
         if enqueue and cls.hidden.prompt and _job_id_to_mj(cls.hidden.unique_id, cls.hidden.prompt, 0):
             print("[MJ] ExtendVideo: enqueue 무시 — job_id가 MJ 잡 서밋 노드에 연결됨")
             enqueue = False
         if enqueue:
             return _enqueue_video_output(job)
-        job = poll_with_progress(job, mode=kw["mode"])
+        job = await poll_with_progress_async(job, "extend_video", mode=kw["mode"])
         return io.NodeOutput(job.id)
 
 
 # ---------------------------------------------------------------------------
-# 12. MidJourneyLoadVideo — 비디오를 메모리로 로드
+# 12. MidJourneyLoadVideo — 비디오 로드 (선택한 변형만, 디스크 캐시)
 # ---------------------------------------------------------------------------
 
 class MidJourneyLoadVideo(io.ComfyNode):
@@ -574,7 +681,7 @@ class MidJourneyLoadVideo(io.ComfyNode):
             node_id="MJ_LoadVideo",
             display_name="MidJourney Load Video",
             category="Midjourney",
-            description="비디오 job_id로 완료된 비디오를 메모리에 로드합니다. batch_size가 2 이상인 경우 batch_index로 다운로드할 변형을 선택합니다.",
+            description="비디오 job_id로 완료된 비디오를 로드합니다. batch_size가 2 이상인 경우 batch_index로 다운로드할 변형을 선택합니다. 선택한 변형만 받아 디스크 캐시에 저장합니다.",
             inputs=[
                 MJ_JOB_ID.Input("job_id", tooltip="비디오 Job ID"),
                 io.Int.Input("batch_index", default=0, min=0, max=3,
@@ -588,12 +695,46 @@ class MidJourneyLoadVideo(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, job_id, batch_index=0, size=None) -> io.NodeOutput:
-        from midjourney_api.models import Job
-        client = get_client()
-        job = Job(id=job_id, prompt="")
-        data_list = client.download_video_bytes(job, size=size or None,
-                                                batch_size=batch_index + 1)
-        data = data_list[batch_index]
+    async def execute(cls, job_id, batch_index=0, size=None) -> io.NodeOutput:
+        path = await asyncio.to_thread(download_video_file, job_id, batch_index, size=size or None)
         log_job("LoadVideo", job_id, index=batch_index)
-        return io.NodeOutput(video_bytes_to_video_input(data))
+        return io.NodeOutput(video_file_to_video_input(path))
+
+
+# ---------------------------------------------------------------------------
+# 13. MidJourneyLoadVideoFrames — 비디오 프레임 구간만 디코드
+# ---------------------------------------------------------------------------
+
+class MidJourneyLoadVideoFrames(io.ComfyNode):
+    @classmethod
+    def define_schema(cls):
+        return io.Schema(
+            node_id="MJ_LoadVideoFrames",
+            display_name="MidJourney Load Video Frames",
+            category="Midjourney",
+            description="비디오 job_id에서 start~end 구간의 프레임을 stride 간격으로만 디코드해 IMAGE 배치로 출력합니다. 첫/마지막/N번째 프레임만 필요할 때 전체 디코드 없이 사용합니다.",
+            inputs=[
+                MJ_JOB_ID.Input("job_id", tooltip="비디오 Job ID"),
+                io.Int.Input("batch_index", default=0, min=0, max=3,
+                             tooltip="다운로드할 배치 변형 인덱스"),
+                io.Int.Input("start", default=0, min=0,
+                             tooltip="첫 프레임 인덱스 (0부터)"),
+                io.Int.Input("end", default=-1, min=-1,
+                             tooltip="마지막 프레임 인덱스 (포함). -1이면 끝까지"),
+                io.Int.Input("stride", default=1, min=1,
+                             tooltip="프레임 간격. 2면 start부터 한 프레임씩 건너뜀"),
+                io.Int.Input("size", optional=True,
+                             tooltip="해상도 (예: 1080). 미지정 시 원본"),
+            ],
+            outputs=[
+                io.Image.Output(display_name="frames"),
+                io.Float.Output(display_name="fps"),
+            ],
+        )
+
+    @classmethod
+    async def execute(cls, job_id, batch_index=0, start=0, end=-1, stride=1, size=None) -> io.NodeOutput:
+        path = await asyncio.to_thread(download_video_file, job_id, batch_index, size=size or None)
+        frames, fps = await asyncio.to_thread(decode_video_frames, path, start, end, stride)
+        log_job("LoadVideoFrames", job_id, index=batch_index, start=start, end=end, stride=stride)
+        return io.NodeOutput(frames, fps)
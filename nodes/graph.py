@@ -0,0 +1,72 @@
+"""prompt 그래프 조회 — (노드 id, 출력 슬롯) → 소비자 역인접 인덱스.
+
+인덱스는 prompt마다 한 번만 만들고 prompt 객체 동일성으로 캐시하므로, 같은 실행 안의
+여러 노드가 연결 여부를 물어도 prompt 전체를 다시 훑지 않습니다.
+실행 중인 큐 항목 조회(running_item)도 여기 둡니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+# (node_id, slot) → [(소비자 node_id, 입력 이름), ...]
+ConsumerIndex = dict[tuple[str, int], list[tuple[str, str]]]
+
+# 캐시할 prompt 수 (prompt 객체를 붙잡아 id 재사용을 막음)
+_CACHE_MAX = 8
+_cache: OrderedDict[int, tuple[dict, ConsumerIndex]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _build(prompt: dict) -> ConsumerIndex:
+    index: ConsumerIndex = {}
+    for consumer_id, node in prompt.items():
+        for name, link in node.get("inputs", {}).items():
+            if isinstance(link, list) and len(link) == 2 and isinstance(link[1], int):
+                index.setdefault((str(link[0]), link[1]), []).append((consumer_id, name))
+    return index
+
+
+def consumer_index(prompt: dict) -> ConsumerIndex:
+    """prompt의 역인접 인덱스. 같은 prompt 객체면 캐시된 인덱스를 반환합니다."""
+    key = id(prompt)
+    with _lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] is prompt:
+            _cache.move_to_end(key)
+            return hit[1]
+    index = _build(prompt)
+    with _lock:
+        _cache[key] = (prompt, index)
+        while len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    return index
+
+
+def running_item(unique_id: str) -> tuple | None:
+    """실행 중인 큐 항목 중 unique_id 노드를 포함한 것.
+
+    ComfyUI는 fingerprint 단계에 hidden prompt를 넘기지 않으므로, PromptServer 실행 큐 항목의
+    내부 레이아웃 (number, prompt_id, prompt, extra_data, outputs_to_execute, ...)에 의존합니다.
+    레이아웃이 달라 찾지 못하면 None — 호출자는 None을 안전한 쪽으로 처리해야 합니다.
+    """
+    try:
+        from server import PromptServer
+        running = list(PromptServer.instance.prompt_queue.currently_running.values())
+    except Exception:
+        return None
+    for item in running:
+        if isinstance(item, (tuple, list)) and len(item) > 2 and isinstance(item[2], dict) and unique_id in item[2]:
+            return tuple(item)
+    return None
+
+
+def consumers(prompt: dict, node_id: str, slot: int) -> list[tuple[str, str]]:
+    """node_id의 출력 slot에 연결된 (소비자 node_id, 입력 이름) 목록."""
+    return consumer_index(prompt).get((str(node_id), slot), [])
+
+
+def consumer_types(prompt: dict, node_id: str, slot: int) -> set[str]:
+    """node_id의 출력 slot을 소비하는 노드들의 class_type."""
+    return {prompt[c].get("class_type") for c, _ in consumers(prompt, node_id, slot) if c in prompt}
@@ -0,0 +1,69 @@
+"""enqueue job 수확 결과 조회 — 노드와 HTTP 라우트."""
+
+from __future__ import annotations
+
+import time
+
+from aiohttp import web as aiohttp_web
+from comfy_api.latest import io
+from server import PromptServer
+
+from ..utils import get_harvester, get_ledger
+
+
+def _harvest_status(since_hours: float) -> tuple[list[dict], list[dict]]:
+    """(since_hours 안에 수확된 job, 아직 수확되지 않은 enqueue job)."""
+    ledger = get_ledger()
+    ready = ledger.harvested(time.time() - since_hours * 3600)
+    pending = ledger.unharvested(since_hours * 3600)
+    return ready, pending
+
+
+@PromptServer.instance.routes.get("/mj/harvest")
+async def _mj_harvest_api(request):
+    try:
+        since_hours = float(request.rel_url.query.get("since_hours", "24"))
+    except ValueError:
+        return aiohttp_web.Response(status=400)
+    ready, pending = _harvest_status(since_hours)
+    return aiohttp_web.json_response({
+        "ready": [
+            {k: r[k] for k in ("job_id", "action", "prompt", "mode", "submitted_at", "harvested_at")}
+            for r in ready
+        ],
+        "pending": [r["job_id"] for r in pending],
+    })
+
+
+class MidJourneyHarvested(io.ComfyNode):
+    @classmethod
+    def define_schema(cls):
+        return io.Schema(
+            node_id="MJ_Harvested",
+            display_name="MidJourney Harvested",
+            category="Midjourney",
+            description="enqueue로 서밋한 job 중 백그라운드 수확기가 결과를 받아 둔 job 목록을 반환합니다. job_ids를 MidJourney Download Bulk에 연결하면 캐시에서 바로 읽습니다. 같은 목록은 /mj/harvest 라우트로도 조회할 수 있습니다.",
+            inputs=[
+                io.Int.Input("since_hours", default=24, min=1, max=24 * 90,
+                             tooltip="최근 N시간 안에 수확된 job"),
+            ],
+            outputs=[
+                io.String.Output(display_name="job_ids"),
+                io.String.Output(display_name="table"),
+                io.Int.Output(display_name="pending"),
+            ],
+        )
+
+    @classmethod
+    def fingerprint_inputs(cls, since_hours):
+        # 수확 목록이 바뀌면 다시 실행
+        ready, pending = _harvest_status(since_hours)
+        return len(ready), len(pending), ready[-1]["harvested_at"] if ready else None
+
+    @classmethod
+    def execute(cls, since_hours) -> io.NodeOutput:
+        get_harvester().wake()
+        ready, pending = _harvest_status(since_hours)
+        lines = ["job_id\taction\tprompt"]
+        lines += [f"{r['job_id']}\t{r['action']}\t{' '.join((r['prompt'] or '').split())}" for r in ready]
+        return io.NodeOutput("\n".join(r["job_id"] for r in ready), "\n".join(lines), len(pending))
@@ -4,15 +4,19 @@ import random
 
 from comfy_api.latest import io
 
-from .keywords import _collect_keyword_files, _merge_keywords
+from .keywords import KeywordKey, _index, _index_lock, get_keywords
 
 
-def _build_category_map() -> dict[str, list]:
-    """(subfolder, stem) → "subfolder/stem" 문자열 키로 변환한 카테고리 맵 반환."""
-    raw = _collect_keyword_files()
+def _build_category_map() -> dict[str, KeywordKey]:
+    """"subfolder/stem" 문자열 키 → 키워드 인덱스 키 (subfolder, stem) 맵 반환.
+
+    인덱스는 keywords 모듈 import 시 이미 컴파일되어 있으므로 파일을 다시 스캔하지 않습니다.
+    """
+    with _index_lock:
+        keys = sorted(_index)
     return {
-        f"{subfolder}/{stem}" if subfolder else stem: paths
-        for (subfolder, stem), paths in sorted(raw.items())
+        f"{subfolder}/{stem}" if subfolder else stem: (subfolder, stem)
+        for subfolder, stem in keys
     }
 
 
@@ -51,10 +55,10 @@ class MidJourneyKeywordRandom(io.ComfyNode):
 
     @classmethod
     def execute(cls, category: str, seed: int) -> io.NodeOutput:
-        paths = _CATEGORY_MAP.get(category, [])
-        if not paths:
+        key = _CATEGORY_MAP.get(category)
+        if key is None:
             return io.NodeOutput("")
-        keywords = _merge_keywords(paths)
+        keywords = get_keywords(key)
         if not keywords:
             return io.NodeOutput("")
         rng = random.Random(seed)
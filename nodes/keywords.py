@@ -3,7 +3,14 @@
 구조: mj/keywords/<subfolder>/<category>.txt
   → ComfyUI 카테고리: Midjourney/keywords/<Subfolder>
   → node_id: MJ_KW_<Subfolder><Category>
+
+파싱 결과는 카테고리별 키워드 튜플과 원본 파일 mtime으로 된 인덱스로 컴파일해
+user/mj/keyword_index.json에 저장합니다. 원본 파일이 바뀐 카테고리만 다시 파싱합니다.
 """
+import json
+import os
+import threading
+import time
 from pathlib import Path
 from comfy_api.latest import io
 import folder_paths
@@ -12,6 +19,10 @@ from .. import _DIR
 _PLUGIN_KEYWORDS_DIR = _DIR / "mj" / "keywords"
 _COMFY_ROOT = Path(folder_paths.base_path)
 _USER_KEYWORDS_DIR = _COMFY_ROOT / "user" / "mj" / "keywords"
+_INDEX_PATH = _COMFY_ROOT / "user" / "mj" / "keyword_index.json"
+_INDEX_VERSION = 1
+# 같은 카테고리의 mtime 재확인 최소 간격(초) — 시드 스윕에서 매 실행 stat을 피함
+_CHECK_INTERVAL = 2.0
 
 
 def _load_keywords(path: Path) -> list[str]:
@@ -54,6 +65,100 @@ def _merge_keywords(paths: list[Path]) -> list[str]:
     return merged
 
 
+# (subfolder, stem) → (키워드 튜플, ((파일 경로, mtime_ns), ...))
+KeywordKey = tuple[str, str]
+Sources = tuple[tuple[str, int], ...]
+_index: dict[KeywordKey, tuple[tuple[str, ...], Sources]] = {}
+_checked: dict[KeywordKey, float] = {}
+_index_lock = threading.Lock()
+
+
+def _sources(paths: list[Path]) -> Sources:
+    """파일별 (경로, mtime_ns). 사라진 파일은 mtime -1."""
+    result = []
+    for p in paths:
+        try:
+            mtime = p.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        result.append((str(p), mtime))
+    return tuple(result)
+
+
+def _compile(sources: Sources) -> tuple[str, ...]:
+    return tuple(_merge_keywords([Path(p) for p, mtime in sources if mtime >= 0]))
+
+
+def _read_index_file() -> dict[KeywordKey, tuple[tuple[str, ...], Sources]]:
+    try:
+        raw = json.loads(_INDEX_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != _INDEX_VERSION:
+        return {}
+    return {
+        (e["subfolder"], e["stem"]): (tuple(e["keywords"]), tuple((p, m) for p, m in e["sources"]))
+        for e in raw.get("categories", [])
+    }
+
+
+def _write_index_file() -> None:
+    """현재 인덱스를 저장. 호출자가 _index_lock을 잡고 있어야 합니다."""
+    data = {
+        "version": _INDEX_VERSION,
+        "categories": [
+            {"subfolder": sub, "stem": stem, "sources": [list(s) for s in sources], "keywords": list(keywords)}
+            for (sub, stem), (keywords, sources) in sorted(_index.items())
+        ],
+    }
+    try:
+        _INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _INDEX_PATH.with_name(_INDEX_PATH.name + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, _INDEX_PATH)
+    except OSError:
+        pass
+
+
+def build_keyword_index() -> dict[KeywordKey, tuple[str, ...]]:
+    """두 경로를 스캔해 인덱스를 만듭니다. 저장된 인덱스와 파일·mtime이 같은 카테고리는 파싱하지 않습니다."""
+    cached = _read_index_file()
+    fresh: dict[KeywordKey, tuple[tuple[str, ...], Sources]] = {}
+    for key, paths in _collect_keyword_files().items():
+        sources = _sources(paths)
+        hit = cached.get(key)
+        fresh[key] = hit if hit is not None and hit[1] == sources else (_compile(sources), sources)
+    now = time.monotonic()
+    with _index_lock:
+        _index.clear()
+        _index.update(fresh)
+        _checked.clear()
+        _checked.update(dict.fromkeys(fresh, now))
+        if fresh != cached:
+            _write_index_file()
+    return {key: keywords for key, (keywords, _) in fresh.items()}
+
+
+def get_keywords(key: KeywordKey) -> tuple[str, ...]:
+    """카테고리의 키워드. 원본 파일 mtime은 _CHECK_INTERVAL마다 한 번만 확인하고, 바뀌었을 때만 다시 파싱합니다."""
+    with _index_lock:
+        entry = _index.get(key)
+        if entry is None:
+            return ()
+        if time.monotonic() - _checked.get(key, 0) < _CHECK_INTERVAL:
+            return entry[0]
+        _checked[key] = time.monotonic()
+    keywords, sources = entry
+    current = _sources([Path(p) for p, _ in sources])
+    if current == sources:
+        return keywords
+    keywords = _compile(current)
+    with _index_lock:
+        _index[key] = (keywords, current)
+        _write_index_file()
+    return keywords
+
+
 def _make_keyword_node(node_id: str, display_name: str, category: str, keywords: list[str]):
     """type() + 클로저로 Combo → String 노드 클래스 동적 생성."""
 
@@ -82,8 +187,8 @@ def _make_keyword_node(node_id: str, display_name: str, category: str, keywords:
 def load_keyword_nodes() -> list[type[io.ComfyNode]]:
     """두 경로를 재귀 스캔해 노드 목록 반환."""
     nodes = []
-    for (subfolder, stem), paths in sorted(_collect_keyword_files().items()):
-        keywords = _merge_keywords(paths)
+    for (subfolder, stem), keywords in sorted(build_keyword_index().items()):
+        keywords = list(keywords)
         if not keywords:
             continue
         display_name = stem.replace("_", " ").title()
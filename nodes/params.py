@@ -6,7 +6,7 @@ import torch
 from comfy_api.latest import io
 
 from .const import *
-from ..utils import image_tensor_to_temp_file, list_presets, load_preset, save_preset
+from ..utils import image_tensor_to_file, list_presets, load_preset, save_preset
 
 # 커스텀 타입
 MJ_PARAMS       = io.Custom("MJ_PARAMS")
@@ -101,15 +101,15 @@ class ImagineV7Params(io.ComfyNode):
 
         # 이미지 프롬프트 — image가 있을 때만 iw 포함
         if image is not None:
-            params["image"] = image_tensor_to_temp_file(image)
+            params["image"] = image_tensor_to_file(image)
             if iw is not None:
                 params["iw"] = iw
 
-        # sref — 이미지 텐서 → 임시 파일 변환, 문자열 → 그대로 사용
+        # sref — 이미지 텐서 → 내용 주소 파일 변환, 문자열 → 그대로 사용
         # sref 없으면 sw/sv 모두 무시. sref가 이미지면 sv 무시.
         if sref is not None and sref != "":
             if isinstance(sref, torch.Tensor):
-                params["sref"] = image_tensor_to_temp_file(sref)
+                params["sref"] = image_tensor_to_file(sref)
                 # 이미지 sref는 코드 버전 개념이 없으므로 sv 무시
             else:
                 params["sref"] = str(sref)
@@ -123,7 +123,7 @@ class ImagineV7Params(io.ComfyNode):
         # oref — sref와 동일한 패턴
         if oref is not None and oref != "":
             if isinstance(oref, torch.Tensor):
-                params["oref"] = image_tensor_to_temp_file(oref)
+                params["oref"] = image_tensor_to_file(oref)
             else:
                 params["oref"] = str(oref)
             if ow is not None:
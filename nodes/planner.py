@@ -0,0 +1,188 @@
+"""프롬프트 단위 서밋 플래너 — 다른 MJ 노드에 의존하지 않는 Imagine 노드를 미리 서밋합니다.
+
+프롬프트에서 처음 실행되는 MJ 노드가 plan_prompt()를 호출하면, 입력을 정적으로 계산할 수 있는
+모든 Imagine 노드를 백그라운드에서 서밋합니다. 각 노드는 실행될 때 같은 서밋 키로 이미 진행 중인
+job을 재사용하므로, 병렬 Imagine 분기들이 차례로가 아니라 동시에 생성됩니다.
+입력 계산은 부작용 없는 파라미터·키워드 노드만 대상으로 하며, 그 밖의 노드(이미지 텐서 등)에
+연결된 Imagine은 건너뜁니다.
+
+이번 실행 대상 출력(부분 실행 포함)의 조상 노드만 계획하며, 실행 대상을 알 수 없으면 계획하지 않습니다.
+같은 입력으로 이미 실행된 Imagine은 ComfyUI가 출력 캐시에서 내주므로 서밋하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import comfy.model_management
+
+from .keyword_random import MidJourneyKeywordRandom
+from .keywords import KEYWORD_NODES
+from .params import ImagineV7Params, LoadImagineParams
+from .graph import running_item
+from ..utils import submission_cache_enabled, submission_key, submit_job
+
+# 한 번 계획한 prompt (id → prompt, 객체를 붙잡아 id 재사용을 막음)
+_PLANNED_MAX = 8
+_planned: OrderedDict[int, dict] = OrderedDict()
+_planned_lock = threading.Lock()
+
+_plan_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mj-planner")
+
+_pure_nodes: dict[str, type] | None = None
+
+# Imagine node_id → 마지막으로 실행한 요청의 서밋 키 (같으면 ComfyUI 출력 캐시가 쓰임)
+_executed: dict[str, str] = {}
+_executed_lock = threading.Lock()
+
+
+class _Unresolved(Exception):
+    """정적으로 계산할 수 없는 입력."""
+
+
+def imagine_request(prompt: str, no: str, params: dict | None) -> dict:
+    """Imagine 입력 → submit_job 인자. 노드 실행과 플래너가 같은 서밋 키를 쓰도록 공유합니다."""
+    kwargs = dict(params) if params else {}
+    mode = kwargs.pop("mode", "fast")
+    if no:
+        kwargs["no"] = no
+    return dict(
+        action="imagine",
+        submit=lambda client: client.imagine(prompt, wait=False, mode=mode, **kwargs),
+        mode=mode,
+        prompt=prompt,
+        params=kwargs,
+    )
+
+
+def _request_key(spec: dict) -> str:
+    return submission_key(spec["action"], spec["mode"], spec["prompt"], params=spec["params"])
+
+
+def note_executed(node_id: str, spec: dict) -> None:
+    """Imagine 노드가 spec(imagine_request)으로 실행됐음을 기록합니다."""
+    key = _request_key(spec)
+    with _executed_lock:
+        _executed[node_id] = key
+
+
+def _will_execute(node_id: str, spec: dict) -> bool:
+    """ComfyUI가 이 노드를 실제로 실행할지. 같은 입력으로 이미 실행됐으면 출력 캐시가 쓰이므로 False.
+
+    캐시가 비워져 실행되는 경우는 노드가 직접 서밋하므로, 판단이 틀려도 선서밋만 빠질 뿐입니다.
+    """
+    with _executed_lock:
+        return _executed.get(node_id) != _request_key(spec)
+
+
+def _execution_targets(current: str | None) -> set[str] | None:
+    """이번 실행 대상 출력 노드 (큐 항목의 outputs_to_execute). 알 수 없으면 None."""
+    item = running_item(current) if current else None
+    if item is None or len(item) < 5 or not isinstance(item[4], (list, tuple, set)):
+        return None
+    return {str(t) for t in item[4]}
+
+
+def _ancestors(prompt: dict, targets: set[str]) -> set[str]:
+    """targets와 그 입력을 따라 닿는 모든 노드."""
+    seen: set[str] = set()
+    stack = [t for t in targets if t in prompt]
+    while stack:
+        node_id = stack.pop()
+        if node_id in seen:
+            continue
+        seen.add(node_id)
+        for link in prompt[node_id].get("inputs", {}).values():
+            if isinstance(link, list) and len(link) == 2 and str(link[0]) in prompt:
+                stack.append(str(link[0]))
+    return seen
+
+
+def _get_pure_nodes() -> dict[str, type]:
+    """실행해도 부작용이 없어 플래너가 직접 계산할 수 있는 노드 (class_type → 클래스)."""
+    global _pure_nodes
+    if _pure_nodes is None:
+        _pure_nodes = {
+            "MJ_ImagineV7Params": ImagineV7Params,
+            "MJ_LoadImagineParams": LoadImagineParams,
+            "MJ_KeywordRandom": MidJourneyKeywordRandom,
+            **{cls.__name__: cls for cls in KEYWORD_NODES},  # 동적 생성 클래스명 = node_id
+        }
+    return _pure_nodes
+
+
+def _resolve(prompt: dict, value, memo: dict):
+    """입력값 하나. 링크([node_id, slot])면 연결된 노드를 계산합니다."""
+    if not (isinstance(value, list) and len(value) == 2 and isinstance(value[0], str)):
+        return value
+    node_id, slot = value
+    if node_id not in memo:
+        node = prompt.get(node_id) or {}
+        cls = _get_pure_nodes().get(node.get("class_type"))
+        if cls is None:
+            raise _Unresolved(node_id)
+        inputs = {name: _resolve(prompt, v, memo) for name, v in node.get("inputs", {}).items()}
+        memo[node_id] = cls.execute(**inputs).args
+    return memo[node_id][slot]
+
+
+def _presubmit(node_id: str, spec: dict) -> None:
+    def interrupt() -> None:
+        # 실행 중단 플래그는 노드 쪽에서 처리하도록 지우지 않고 확인만 함
+        if comfy.model_management.processing_interrupted():
+            raise comfy.model_management.InterruptProcessingException()
+
+    try:
+        submit_job(**spec, interrupt=interrupt)
+    except comfy.model_management.InterruptProcessingException:
+        pass
+    except Exception as e:
+        print(f"[MJ] 플래너: Imagine #{node_id} 선서밋 실패 (노드 실행 시 다시 시도): {e}")
+
+
+def plan_prompt(prompt: dict | None, current: str | None = None) -> int:
+    """prompt의 독립 Imagine 노드를 백그라운드에서 서밋합니다. prompt당 한 번만 동작합니다.
+
+    current: 호출한 노드 id (직접 서밋하므로 제외, 실행 큐 항목 조회에도 사용).
+    선서밋을 시작한 노드 수를 반환합니다.
+    """
+    if not prompt or not submission_cache_enabled():
+        return 0
+    targets = _execution_targets(current)
+    if targets is None:
+        return 0
+    with _planned_lock:
+        if id(prompt) in _planned:
+            return 0
+        _planned[id(prompt)] = prompt
+        while len(_planned) > _PLANNED_MAX:
+            _planned.popitem(last=False)
+
+    memo: dict = {}
+    count = 0
+    scheduled = _ancestors(prompt, targets)
+    for node_id, node in prompt.items():
+        if node.get("class_type") != "MJ_Imagine" or node_id == current or node_id not in scheduled:
+            continue
+        inputs = node.get("inputs", {})
+        try:
+            text = _resolve(prompt, inputs.get("prompt"), memo)
+            no = _resolve(prompt, inputs.get("no", ""), memo)
+            params = _resolve(prompt, inputs.get("params"), memo)
+        except _Unresolved:
+            continue
+        except Exception as e:
+            print(f"[MJ] 플래너: Imagine #{node_id} 입력 계산 실패: {e}")
+            continue
+        if not isinstance(text, str):
+            continue
+        spec = imagine_request(text, no or "", params)
+        if not _will_execute(node_id, spec):
+            continue
+        _plan_pool.submit(_presubmit, node_id, spec)
+        count += 1
+    if count:
+        print(f"[MJ] 플래너: 독립 Imagine {count}개 선서밋")
+    return count
@@ -0,0 +1,219 @@
+"""공용 Job 상태 폴러 — 하나의 asyncio 루프에서 모든 미완료 job을 확인."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from midjourney_api.exceptions import MidjourneyError
+from midjourney_api.models import Job
+
+
+class PollTimeoutError(MidjourneyError):
+    """watch()의 timeout 안에 job이 완료되지 않음."""
+
+
+def _retryable(e: Exception) -> bool:
+    """상태 조회 오류가 일시적인지. 연결·타임아웃 오류와 5xx/429 응답은 재시도합니다."""
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status >= 500 or status in (408, 429)
+    return isinstance(e, (OSError, asyncio.TimeoutError))
+
+
+class DurationStats:
+    """(action, mode)별 최근 완료 소요 시간 기록. JSON 파일에 영속화됩니다."""
+
+    def __init__(self, path: Path, window: int = 20):
+        self._path = path
+        self._window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raw = {}
+        for key, values in raw.items():
+            self._samples[key] = deque(values, maxlen=window)
+
+    @staticmethod
+    def _key(action: str, mode: str) -> str:
+        return f"{action}/{mode}"
+
+    def expected(self, action: str, mode: str) -> float | None:
+        """기록된 소요 시간의 중앙값. 기록이 없으면 None."""
+        with self._lock:
+            samples = self._samples.get(self._key(action, mode))
+            return statistics.median(samples) if samples else None
+
+    def record(self, action: str, mode: str, seconds: float) -> None:
+        with self._lock:
+            key = self._key(action, mode)
+            self._samples.setdefault(key, deque(maxlen=self._window)).append(round(seconds, 2))
+            data = {k: list(v) for k, v in self._samples.items()}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except OSError:
+            pass
+
+
+@dataclass
+class _Watch:
+    job_id: str
+    future: Future
+    timeout: float
+    deadline: float
+    interval: float
+    next_check: float = field(default_factory=time.time)
+    checked: bool = False  # 상태 조회를 한 번이라도 했는지 (조회 없이 타임아웃하지 않음)
+
+
+class JobPoller:
+    """백그라운드 스레드의 이벤트 루프에서 등록된 job들을 일괄 폴링합니다.
+
+    watch()는 job별 ``concurrent.futures.Future``를 반환하며, 완료 시 Job으로 resolve됩니다.
+    동기 코드는 ``future.result()``로, 비동기 코드는 ``asyncio.wrap_future()``로 기다립니다.
+    같은 job_id를 여러 번 watch하면 같은 Future를 공유합니다.
+
+    eta가 주어지면 첫 확인을 예상 완료 시점 직전으로 미루고, 이후 간격을 점점 늘립니다.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Job | None],
+        poll_interval: float = 5,
+        max_interval: float = 30,
+        backoff: float = 1.5,
+        max_concurrency: int = 8,
+    ):
+        self._fetch = fetch
+        self._poll_interval = poll_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._watches: dict[str, _Watch] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def watch(self, job_id: str, timeout: float = 600, eta: float | None = None) -> Future:
+        """job_id를 폴링 대상에 추가하고 완료 Future를 반환합니다.
+
+        eta: 예상 소요 시간(초). 첫 확인은 eta의 90% 시점(단, timeout 전), 이후 eta의 10%(2초 이상)부터 백오프.
+        timeout이 지나도 최소 한 번은 상태를 조회한 뒤에 타임아웃합니다.
+        """
+        return self.register(job_id, timeout=timeout, eta=eta)[0]
+
+    def register(self, job_id: str, timeout: float = 600, eta: float | None = None) -> tuple[Future, bool]:
+        """watch()와 같지만 (Future, 새로 등록됐는지)를 반환합니다.
+
+        이미 폴링 중인 job이면 기존 Future를 공유하므로, 완료 콜백은 새로 등록됐을 때만 붙이면 됩니다.
+        """
+        created = False
+        with self._lock:
+            w = self._watches.get(job_id)
+            if w is None:
+                created = True
+                now = time.time()
+                deadline = now + timeout
+                if eta:
+                    interval = min(max(eta * 0.1, 2.0), self._poll_interval)
+                    # 학습된 ETA가 timeout보다 길어도 deadline 전에 확인
+                    first = max(now, min(now + eta * 0.9, deadline - interval))
+                else:
+                    first = now
+                    interval = self._poll_interval
+                w = _Watch(job_id, Future(), timeout, deadline, interval, next_check=first)
+                self._watches[job_id] = w
+            self._ensure_started()
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+        return w.future, created
+
+    def pending(self) -> list[str]:
+        """아직 완료되지 않은 job_id 목록."""
+        with self._lock:
+            return list(self._watches)
+
+    # -- 내부 -----------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._wakeup = asyncio.Event()
+        threading.Thread(target=self._loop.run_until_complete, args=(self._run(),),
+                         name="mj-job-poller", daemon=True).start()
+
+    async def _run(self) -> None:
+        sem = asyncio.Semaphore(self._max_concurrency)
+        while True:
+            now = time.time()
+            with self._lock:
+                due = [w for w in self._watches.values() if w.next_check <= now]
+            if due:
+                # 만기된 job들을 한 번에 확인 — 동시 요청 수는 세마포어로 제한
+                results = await asyncio.gather(*(self._check(w, sem) for w in due), return_exceptions=True)
+                for w, result in zip(due, results):
+                    if isinstance(result, BaseException):
+                        # job 하나의 오류가 폴러 스레드를 끝내지 않도록 그 job만 실패 처리
+                        print(f"[MJ] job={w.job_id} 폴링 오류: {result!r}")
+                        self._finish(w, error=result if isinstance(result, Exception) else RuntimeError(repr(result)))
+
+            with self._lock:
+                next_at = min((w.next_check for w in self._watches.values()), default=None)
+            delay = None if next_at is None else max(0.0, next_at - time.time())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, w: _Watch, sem: asyncio.Semaphore) -> None:
+        if w.checked and time.time() >= w.deadline:
+            self._timeout(w)
+            return
+        async with sem:
+            try:
+                job = await asyncio.get_running_loop().run_in_executor(None, self._fetch, w.job_id)
+            except Exception as e:
+                if not _retryable(e):
+                    self._finish(w, error=e)
+                    return
+                # 일시적인 상태 조회 오류 — job은 계속 진행 중일 수 있으므로 deadline까지 재시도
+                print(f"[MJ] job={w.job_id} 상태 조회 실패, {w.interval:.0f}초 후 재시도: {e}")
+                job = None
+        w.checked = True
+        if job is not None:
+            self._finish(w, result=job)
+        elif time.time() >= w.deadline:
+            self._timeout(w)
+        else:
+            w.next_check = time.time() + w.interval
+            w.interval = min(w.interval * self._backoff, self._max_interval)
+
+    def _timeout(self, w: _Watch) -> None:
+        self._finish(w, error=PollTimeoutError(f"Job {w.job_id}이(가) {w.timeout}초 후 타임아웃되었습니다"))
+
+    def _finish(self, w: _Watch, result: Job | None = None, error: Exception | None = None) -> None:
+        with self._lock:
+            if self._watches.get(w.job_id) is w:
+                del self._watches[w.job_id]
+        # 취소됐거나 이미 끝난 Future에는 결과를 넣지 않음
+        if w.future.done():
+            return
+        try:
+            if error is not None:
+                w.future.set_exception(error)
+            else:
+                w.future.set_result(result)
+        except InvalidStateError:
+            pass  # 확인 직후 취소됨
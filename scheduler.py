@@ -0,0 +1,85 @@
+"""계정 단위 job 동시 실행 스케줄러 — 모드별 슬롯 수를 넘지 않도록 서밋을 대기시킵니다."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from typing import Callable
+
+# 슬롯이 날 때까지 기다리는 동안 interrupt 확인 간격(초)
+_WAIT_SLICE = 0.5
+
+
+class JobScheduler:
+    """speed 모드(fast/relax/turbo)별 동시 job 슬롯.
+
+    acquire()는 슬롯이 빌 때까지 블록하며, 대기 순서는 priority(클수록 먼저) → 도착 순(FIFO)입니다.
+    슬롯은 job 완료(폴러가 결과를 확인한 시점)에 release()로 반환됩니다.
+    """
+
+    def __init__(self, limits: dict[str, int], default_limit: int = 3):
+        self._limits = dict(limits)
+        self._default_limit = default_limit
+        self._cond = threading.Condition()
+        self._in_use: dict[str, int] = {}
+        self._waiting: dict[str, list[tuple[int, int]]] = {}
+        self._seq = itertools.count()
+
+    def limit(self, mode: str) -> int:
+        return self._limits.get(str(mode), self._default_limit)
+
+    def in_use(self, mode: str) -> int:
+        with self._cond:
+            return self._in_use.get(str(mode), 0)
+
+    def headroom(self, mode: str) -> int:
+        """한도 - 사용 중 - 대기 중. 대기열이 길면 음수가 됩니다."""
+        mode = str(mode)
+        with self._cond:
+            return self.limit(mode) - self._in_use.get(mode, 0) - len(self._waiting.get(mode, ()))
+
+    def free(self, mode: str) -> int:
+        """지금 바로 쓸 수 있는 슬롯 수 (대기 중인 요청 제외)."""
+        return max(0, self.headroom(mode))
+
+    def acquire(
+        self,
+        mode: str,
+        priority: int = 0,
+        interrupt: Callable[[], None] | None = None,
+    ) -> None:
+        """mode의 슬롯 하나를 얻을 때까지 기다립니다.
+
+        interrupt: 대기 중 주기적으로 호출되며, 예외를 던지면 대기를 취소하고 그대로 전파합니다.
+        """
+        mode = str(mode)
+        ticket = (-priority, next(self._seq))
+        with self._cond:
+            queue = self._waiting.setdefault(mode, [])
+            heapq.heappush(queue, ticket)
+            try:
+                while queue[0] != ticket or self._in_use.get(mode, 0) >= self.limit(mode):
+                    self._cond.wait(_WAIT_SLICE)
+                    if interrupt is not None:
+                        interrupt()
+            except BaseException:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(queue)
+            self._in_use[mode] = self._in_use.get(mode, 0) + 1
+            self._cond.notify_all()
+
+    def hold(self, mode: str) -> None:
+        """대기 없이 슬롯 하나를 점유합니다. 재시작 후 이미 실행 중인 job을 반영할 때 사용."""
+        mode = str(mode)
+        with self._cond:
+            self._in_use[mode] = self._in_use.get(mode, 0) + 1
+
+    def release(self, mode: str) -> None:
+        mode = str(mode)
+        with self._cond:
+            self._in_use[mode] = max(0, self._in_use.get(mode, 0) - 1)
+            self._cond.notify_all()
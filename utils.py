@@ -2,37 +2,428 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
 import tempfile
+import threading
 import time
+from datetime import date
+from concurrent.futures import (FIRST_COMPLETED, CancelledError, Future, InvalidStateError,
+                                ThreadPoolExecutor, TimeoutError as FutureTimeout, wait)
 from io import BytesIO
 from pathlib import Path
+from typing import Callable
 
 import numpy as np
+import requests
 import torch
 from PIL import Image
 
+import comfy.model_management
 import comfy.utils
 from midjourney_api import MidjourneyClient
 from midjourney_api.models import Job
 
+from .accounts import PRIMARY, AccountPool, fast_cost
+from .cache import DiskLRU, TensorLRU
+from .harvester import Harvester
+from .ledger import COMPLETED, FAILED, SUBMITTED, TIMEOUT, JobLedger
+from .poller import DurationStats, JobPoller, PollTimeoutError
+from .scheduler import JobScheduler
+
 _DIR = Path(__file__).parent
 _ENV_PATH = _DIR.parent.parent / ".env"  # ComfyUI root
+_USER_DIR = _DIR.parent.parent / "user" / "mj"  # ComfyUI 루트의 user/mj
 _PRESETS_DIR = _DIR / "presets"
 
 # ---------------------------------------------------------------------------
-# 클라이언트 싱글톤
+# 클라이언트 / 계정 풀
+# ---------------------------------------------------------------------------
+
+# 추가 계정 .env 경로 목록 (.env의 MJ_ACCOUNT_ENVS, 쉼표 구분, ComfyUI 루트 기준 상대 경로 가능)
+_ACCOUNT_ENVS = [p.strip() for p in os.environ.get("MJ_ACCOUNT_ENVS", "").split(",") if p.strip()]
+
+_pool: AccountPool | None = None
+
+
+def _account_limits(account) -> dict[str, int]:
+    """계정별 모드 슬롯 한도 (계정 .env의 MJ_MAX_JOBS_FAST / RELAX / TURBO)."""
+    return {m: int(account.setting(f"MJ_MAX_JOBS_{m.upper()}", _DEFAULT_MAX_JOBS)) for m in _DEFAULT_ETA}
+
+
+def get_account_pool() -> AccountPool:
+    global _pool
+    if _pool is None:
+        paths = [_ENV_PATH] + [_ENV_PATH.parent / p for p in _ACCOUNT_ENVS]
+        _pool = AccountPool.from_env_files(paths, _account_limits, _DEFAULT_MAX_JOBS)
+    return _pool
+
+
+def get_client(account: str | None = None) -> MidjourneyClient:
+    """account 이름의 클라이언트. None이면 기본(.env) 계정."""
+    return get_account_pool().get(account).client()
+
+
+def account_of(job_id: str | None) -> str | None:
+    """원장에 기록된 job 소유 계정. 기록이 없으면 None(기본 계정)."""
+    if not job_id:
+        return None
+    row = get_ledger().get(job_id)
+    return row["account"] if row else None
+
+
+def _fast_seconds_used(account) -> float:
+    """이번 달(달력 기준) account가 쓴 fast 시간 추정치(초). turbo는 2배로 계산."""
+    since = time.mktime(date.today().replace(day=1).timetuple())
+    busy = get_ledger().busy_seconds(account.name, since, include_null=account.name == PRIMARY)
+    return sum(seconds * fast_cost(mode) for mode, seconds in busy.items())
+
+
+# ---------------------------------------------------------------------------
+# 공용 폴러 싱글톤
+# ---------------------------------------------------------------------------
+
+_POLL_INTERVAL = 5
+
+# 기록이 없을 때 사용하는 모드별 예상 소요 시간(초)
+_DEFAULT_ETA = {"turbo": 25, "fast": 50, "relax": 180}
+
+# 슬롯·원장 추적용 폴링 시간 한도(초). 노드의 대기 timeout과 별개로, relax job처럼 오래 걸리는
+# job이 끝나기 전에 슬롯이 반환되거나 원장에 타임아웃으로 남지 않도록 넉넉하게 둠
+_TRACK_TIMEOUT = {"turbo": 3600, "fast": 3600, "relax": 6 * 3600}
+
+# 소요 시간 표본으로 인정할 서밋~폴링 등록 간격(초). 재시작 후 재개했거나 오래된 원장 행을
+# 재사용한 job은 서밋부터 지켜보지 못했으므로 ETA 통계에 넣지 않음
+_SAMPLE_MAX_LAG = 60
+
+# 재시작 시 원장에서 폴링을 재개할 job의 최대 경과 시간(초)
+_RESUME_WINDOW = 24 * 3600
+
+# 같은 요청의 재서밋 대신 기존 job 재사용 여부 (.env에서 MJ_SUBMIT_CACHE=0으로 끔)
+_SUBMIT_CACHE = os.environ.get("MJ_SUBMIT_CACHE", "1") != "0"
+
+# 파일 경로 대신 내용 해시로 키를 만드는 이미지 파라미터
+_IMAGE_PARAMS = ("image", "sref", "oref", "start_image", "end_image")
+
+# 모드별 계정 동시 job 한도 기본값 (계정 .env의 MJ_MAX_JOBS_FAST / MJ_MAX_JOBS_RELAX / MJ_MAX_JOBS_TURBO)
+_DEFAULT_MAX_JOBS = 3
+
+_poller: JobPoller | None = None
+_stats: DurationStats | None = None
+_ledger: JobLedger | None = None
+
+
+def _as_completed(job: Job) -> Job:
+    job.status = "completed"
+    job.progress = 100
+    job.image_urls = [job.cdn_url(i) for i in range(4)]
+    return job
+
+
+def _fetch_completed(job_id: str) -> Job | None:
+    """완료된 job이면 Job을, 진행 중이면 None을 반환합니다."""
+    completed = get_client(account_of(job_id))._api.get_job_status(job_id)
+    return _as_completed(completed) if completed is not None else None
+
+
+def check_job(job_id: str) -> Job | None:
+    """job이 완료됐으면 Job, 진행 중이면 None. 원장에 완료로 기록된 job은 조회 없이 반환합니다."""
+    ledger = get_ledger()
+    row = ledger.get(job_id)
+    if row and row["status"] == COMPLETED:
+        return _as_completed(Job(id=job_id, prompt=row["prompt"] or ""))
+    job = _fetch_completed(job_id)
+    if job is not None and row:
+        ledger.mark(job_id, COMPLETED)
+    return job
+
+
+def get_poller() -> JobPoller:
+    global _poller
+    if _poller is None:
+        _poller = JobPoller(_fetch_completed, poll_interval=_POLL_INTERVAL)
+    return _poller
+
+
+def get_scheduler(account: str | None = None) -> JobScheduler:
+    """account의 동시 job 스케줄러. None이면 기본 계정."""
+    return get_account_pool().get(account).scheduler
+
+
+def get_duration_stats() -> DurationStats:
+    global _stats
+    if _stats is None:
+        _stats = DurationStats(_USER_DIR / "durations.json")
+    return _stats
+
+
+def get_ledger() -> JobLedger:
+    global _ledger
+    if _ledger is None:
+        _ledger = JobLedger(_USER_DIR / "jobs.sqlite3")
+    return _ledger
+
+
+def estimate_duration(action: str, mode: str) -> float:
+    """(action, mode)의 예상 소요 시간. 기록이 없으면 모드별 기본값."""
+    eta = get_duration_stats().expected(action, mode)
+    return eta if eta is not None else _DEFAULT_ETA.get(str(mode), _DEFAULT_ETA["fast"])
+
+
+def track_timeout(mode: str) -> float:
+    """mode별 슬롯·원장 추적 시간 한도."""
+    return _TRACK_TIMEOUT.get(str(mode), _TRACK_TIMEOUT["relax"])
+
+
+def watch_job(
+    job_id: str,
+    action: str,
+    mode: str,
+    timeout: float | None = None,
+    submitted_at: float | None = None,
+) -> Future:
+    """공용 폴러에 job을 등록합니다. 완료 시 소요 시간 기록과 원장 갱신이 이뤄집니다.
+
+    이미 폴링 중인 job이면 같은 Future를 반환하며, 기록 콜백은 처음 등록할 때 한 번만 붙습니다.
+    소요 시간은 서밋 직후부터 지켜본 job이 timeout 안에 끝났을 때만 기록합니다.
+    """
+    mode = str(mode)
+    timeout = timeout or track_timeout(mode)
+    submitted_at = submitted_at or time.time()
+    observed = time.time() - submitted_at <= _SAMPLE_MAX_LAG
+    eta = max(0.0, estimate_duration(action, mode) - (time.time() - submitted_at))
+    future, created = get_poller().register(job_id, timeout=timeout, eta=eta)
+    if not created:
+        return future
+
+    def _on_done(f: Future) -> None:
+        if f.cancelled():
+            return
+        exc = f.exception()
+        if exc is None:
+            elapsed = time.time() - submitted_at
+            if observed and elapsed <= timeout:
+                get_duration_stats().record(action, mode, elapsed)
+            get_ledger().mark(job_id, COMPLETED)
+        elif isinstance(exc, PollTimeoutError):
+            get_ledger().mark(job_id, TIMEOUT)
+        else:
+            # 재시도할 수 없는 상태 조회 오류 — 같은 요청은 다시 서밋하도록
+            get_ledger().mark(job_id, FAILED)
+
+    future.add_done_callback(_on_done)
+    return future
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _canonical_params(params: dict) -> dict:
+    """이미지 파라미터의 로컬 파일 경로를 내용 해시로 치환합니다."""
+    out = {}
+    for k, v in params.items():
+        if k in _IMAGE_PARAMS and isinstance(v, str):
+            path = Path(v)
+            if path.parent == _ASSET_DIR:
+                v = f"asset:{path.stem}"  # 저장소 파일은 이름이 곧 내용 해시
+            elif path.is_file():
+                v = f"sha256:{_file_digest(v)}"
+        out[k] = v
+    return out
+
+
+def submission_cache_enabled() -> bool:
+    """동일 요청 재사용(MJ_SUBMIT_CACHE)이 켜져 있으면 True."""
+    return _SUBMIT_CACHE
+
+
+def submission_key(
+    action: str,
+    mode: str,
+    prompt: str = "",
+    source: str | None = None,
+    index: int | None = None,
+    params: dict | None = None,
+) -> str:
+    """action·prompt·params·원본 job/index로 만든 정규화 해시. 같은 요청이면 같은 키."""
+    payload = {
+        "action": action,
+        "mode": str(mode),
+        "prompt": (prompt or "").strip(),
+        "source": source,
+        "index": index,
+        "params": _canonical_params(params or {}),
+    }
+    text = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# 서밋 진행 중인 submission_key → 결과 Future (동시에 들어온 같은 요청의 중복 서밋 방지)
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def submit_job(
+    action: str,
+    submit: Callable[[MidjourneyClient], Job],
+    mode: str,
+    prompt: str = "",
+    source: str | None = None,
+    index: int | None = None,
+    params: dict | None = None,
+    priority: int = 0,
+    interrupt: Callable[[], None] | None = None,
+) -> Job:
+    """submit()으로 job을 서밋하고 원장에 기록합니다. 모든 생성 노드의 서밋 경로.
+
+    같은 요청(submission_key)으로 서밋된 job이 원장에 있으면 다시 서밋하지 않고 그 job을 반환합니다.
+    같은 요청이 다른 스레드에서 서밋 중이면(플래너의 선서밋 등) 그 결과를 기다려 재사용합니다.
+    새로 서밋할 때는 계정을 고르고(source가 있으면 원본 job 소유 계정, 없으면 여유 슬롯과
+    fast 시간 잔량 기준) 그 계정 스케줄러의 mode 슬롯을 얻은 뒤 submit(client)을 호출합니다.
+    priority가 클수록 먼저 슬롯을 얻으며, 슬롯은 job이 완료되면 반환됩니다.
+    interrupt: 대기 중 호출할 취소 확인 함수 (기본: ComfyUI 실행 중단 확인).
+    """
+    mode = str(mode)
+    interrupt = interrupt or comfy.model_management.throw_exception_if_processing_interrupted
+    key = submission_key(action, mode, prompt, source, index, params) if _SUBMIT_CACHE else None
+    if not key:
+        return _submit_new(action, submit, mode, prompt, source, index, params, priority, interrupt, None)
+
+    while True:
+        row = get_ledger().find_by_key(key)
+        if row is not None:
+            print(f"[MJ] {action}: 동일 요청 재사용 — job={_GRAY}{row['job_id']}{_RST} ({row['status']})")
+            return Job(id=row["job_id"], prompt=row["prompt"] or "")
+        with _inflight_lock:
+            running = _inflight.get(key)
+            if running is None:
+                mine = _inflight[key] = Future()
+                break
+        # 먼저 시작한 서밋이 끝나면 원장을 다시 확인 (실패했으면 직접 서밋)
+        while not running.done():
+            wait([running], timeout=0.5)
+            interrupt()
+
+    try:
+        job = _submit_new(action, submit, mode, prompt, source, index, params, priority, interrupt, key)
+        mine.set_result(job)
+        return job
+    except BaseException as e:
+        mine.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _submit_new(
+    action: str,
+    submit: Callable[[MidjourneyClient], Job],
+    mode: str,
+    prompt: str,
+    source: str | None,
+    index: int | None,
+    params: dict | None,
+    priority: int,
+    interrupt: Callable[[], None],
+    key: str | None,
+) -> Job:
+    """계정 선택 → 슬롯 획득 → 서밋 → 원장 기록. 슬롯은 job 완료 시 반환됩니다."""
+    pool = get_account_pool()
+    account = pool.get(account_of(source)) if source else pool.pick(mode, _fast_seconds_used)
+    if len(pool) > 1:
+        print(f"[MJ] {action}: 계정 {account.name}")
+    scheduler = account.scheduler
+    if not scheduler.free(mode):
+        print(f"[MJ] {action}: {mode} 슬롯 대기 중 ({scheduler.in_use(mode)}/{scheduler.limit(mode)})")
+    scheduler.acquire(mode, priority=priority, interrupt=interrupt)
+    try:
+        job = submit(account.client())
+    except BaseException:
+        scheduler.release(mode)
+        raise
+    if not job.id:
+        scheduler.release(mode)
+        return job
+    get_ledger().record_submit(job.id, action, mode, prompt=prompt, source_job=source,
+                               source_index=index, params=params, submit_key=key, account=account.name)
+    # 슬롯은 폴러가 완료(또는 mode별 추적 한도 초과)를 확인할 때 반환 — enqueue job도 여기서 추적됨
+    watch_job(job.id, action, mode).add_done_callback(lambda _f: scheduler.release(mode))
+    return job
+
+
+async def submit_job_async(*args, **kwargs) -> Job:
+    """submit_job의 비동기 버전. 슬롯 대기와 서밋은 워커 스레드에서 이뤄집니다."""
+    return await asyncio.to_thread(submit_job, *args, **kwargs)
+
+
+def resume_unfinished_jobs() -> int:
+    """원장에 남은 미완료 job의 폴링을 재개합니다. 재개한 job 수를 반환합니다."""
+    rows = get_ledger().unfinished(_RESUME_WINDOW)
+    for row in rows:
+        future = watch_job(row["job_id"], row["action"], row["mode"], submitted_at=row["submitted_at"])
+        if row["status"] == SUBMITTED:
+            # 아직 계정에서 실행 중일 수 있으므로 완료될 때까지 슬롯을 점유
+            mode = row["mode"]
+            scheduler = get_scheduler(row["account"])
+            scheduler.hold(mode)
+            future.add_done_callback(lambda _f, m=mode, s=scheduler: s.release(m))
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# enqueue job 수확기
 # ---------------------------------------------------------------------------
 
-_client: MidjourneyClient | None = None
+# 미완료 enqueue job 확인 주기(초) (.env의 MJ_HARVEST_INTERVAL)
+_HARVEST_INTERVAL = float(os.environ.get("MJ_HARVEST_INTERVAL", "60"))
+
+# 비디오 결과를 내는 action
+_VIDEO_ACTIONS = ("animate", "extend_video")
+
+_harvester: Harvester | None = None
+
 
+def _harvest_job(job: Job, row: dict) -> None:
+    """완료된 enqueue job의 결과를 디스크 캐시에 받아 둡니다."""
+    if row["action"] in _VIDEO_ACTIONS:
+        batch_size = int(json.loads(row["params"] or "{}").get("batch_size") or 1)
+        for i in range(batch_size):
+            download_video_file(job.id, i)
+        return
+    indices = [0] if row["action"] == "upscale" else range(4)
+    list(_download_pool.map(lambda i: _fetch_image_bytes(job, i, 1024), indices))
 
-def get_client() -> MidjourneyClient:
-    global _client
-    if _client is None:
-        _client = MidjourneyClient(env_path=str(_ENV_PATH))
-    return _client
+
+def get_harvester() -> Harvester:
+    global _harvester
+    if _harvester is None:
+        _harvester = Harvester(get_ledger(), check_job, _harvest_job,
+                               interval=_HARVEST_INTERVAL, max_age=_RESUME_WINDOW)
+    return _harvester
+
+
+def mark_enqueued(job_id: str) -> None:
+    """enqueue 모드로 반환한 job을 수확 대상으로 기록합니다. 완료되는 즉시 수확기가 결과를 받습니다."""
+    if not job_id:
+        return
+    ledger = get_ledger()
+    ledger.mark_enqueued(job_id)
+    harvester = get_harvester()
+    harvester.start()
+    row = ledger.get(job_id)
+    if row is None:
+        return
+    # 폴링 등록은 watch_job으로만 — 먼저 등록한 쪽에만 완료 기록 콜백이 붙으므로
+    future = watch_job(job_id, row["action"], row["mode"], submitted_at=row["submitted_at"])
+    future.add_done_callback(lambda _f: harvester.wake())
 
 
 # ---------------------------------------------------------------------------
@@ -40,34 +431,149 @@ def get_client() -> MidjourneyClient:
 # ---------------------------------------------------------------------------
 
 
-def poll_with_progress(
+def _job_future(job: Job, action: str, mode: str) -> tuple[Future, float]:
+    """(job 완료 Future, 서밋 시각). 서밋 시각은 원장 기록 기준이며, 기록이 없으면 지금.
+
+    Future는 슬롯·원장 추적용 폴링(track_timeout)이 끝날 때 resolve되며, 호출자의 대기 timeout은
+    호출자가 따로 적용합니다 — 대기를 포기해도 job 추적은 계속됩니다.
+    """
+    row = get_ledger().get(job.id)
+    if row and row["status"] == COMPLETED:
+        future = Future()
+        future.set_result(_as_completed(job))
+        return future, row["submitted_at"]
+    # 재사용한 job(캐시 적중, 플래너 선서밋)도 실제 서밋 시각부터 소요 시간과 ETA를 계산
+    submitted_at = row["submitted_at"] if row else time.time()
+    return watch_job(job.id, action, mode, submitted_at=submitted_at), submitted_at
+
+
+def job_future(job: Job, action: str, mode: str) -> Future:
+    """job 완료 Future. 원장에 이미 완료로 기록된 job은 폴링 없이 완료된 Future를 반환합니다."""
+    return _job_future(job, action, mode)[0]
+
+
+def _detached(future: Future) -> Future:
+    """future의 결과를 받아 오는 별도 Future. asyncio 대기자가 취소돼도 공유 Future(슬롯·원장 추적)는 유지됩니다."""
+    child: Future = Future()
+
+    def _copy(f: Future) -> None:
+        try:
+            if f.cancelled():
+                child.cancel()
+            elif f.exception() is not None:
+                child.set_exception(f.exception())
+            else:
+                child.set_result(f.result())
+        except InvalidStateError:
+            pass  # 대기자가 먼저 취소함
+
+    future.add_done_callback(_copy)
+    return child
+
+
+def _wait_timeout(job: Job, timeout: float) -> PollTimeoutError:
+    return PollTimeoutError(f"Job {job.id}이(가) {timeout}초 후 타임아웃되었습니다")
+
+
+async def _await_job(
     job: Job,
-    poll_interval: float = 5,
-    timeout: float = 600,
-    **_kwargs,
+    action: str,
+    mode: str,
+    timeout: float,
+    progress: Callable[[float], None] | None = None,
 ) -> Job:
-    """Job 상태를 폴링하고, 완료 시 ComfyUI에 100% 진행률을 보고합니다."""
+    """job 완료를 기다립니다. 0.5초마다 실행 중단을 확인하고, progress(서밋 후 경과 초)를 호출합니다.
+
+    timeout이 지나면 PollTimeoutError를 내지만 job의 슬롯·원장 추적은 계속됩니다.
+    """
     if not job.id:
         raise RuntimeError("Job 제출 실패: API에서 빈 job ID가 반환되었습니다")
+    future, start = _job_future(job, action, mode)
+    future = asyncio.wrap_future(_detached(future))
+    deadline = time.time() + timeout
+    while True:
+        done, _ = await asyncio.wait({future}, timeout=0.5)
+        if done:
+            return future.result()
+        comfy.model_management.throw_exception_if_processing_interrupted()
+        if time.time() >= deadline:
+            raise _wait_timeout(job, timeout)
+        if progress is not None:
+            progress(time.time() - start)
 
-    client = get_client()
-    pbar = comfy.utils.ProgressBar(1)
-    start = time.time()
 
-    while True:
-        if time.time() - start >= timeout:
-            from midjourney_api.exceptions import MidjourneyError
-            raise MidjourneyError(f"Job {job.id}이(가) {timeout}초 후 타임아웃되었습니다")
+async def wait_job_async(job: Job, action: str, mode: str, timeout: float = 600) -> Job:
+    """진행률 표시 없이 job 완료를 기다립니다. 여러 job을 함께 기다릴 때 사용합니다."""
+    return await _await_job(job, action, mode, timeout)
 
-        completed = client._api.get_job_status(job.id)
-        if completed is not None:
-            completed.status = "completed"
-            completed.progress = 100
-            completed.image_urls = [completed.cdn_url(i) for i in range(4)]
-            pbar.update_absolute(1)
-            return completed
 
-        time.sleep(poll_interval)
+async def poll_with_progress_async(
+    job: Job,
+    action: str = "",
+    mode: str = "fast",
+    timeout: float = 600,
+) -> Job:
+    """공용 폴러에 Job을 등록하고 완료를 기다리며 예상 소요 시간 기준 진행률을 보고합니다.
+
+    action/mode별 완료 시간 기록으로 첫 폴링 시점과 진행률 ETA를 정합니다. 진행률은 원장의 서밋 시각부터 셉니다.
+    원장에 이미 완료로 기록된 job은 폴링 없이 바로 반환합니다. 기다리는 동안 이벤트 루프를 막지 않습니다.
+    """
+    pbar = comfy.utils.ProgressBar(100)
+    eta = estimate_duration(action, str(mode))
+    # ETA를 넘겨도 완료 전까지는 99%에 머무름
+    completed = await _await_job(job, action, mode, timeout,
+                                 progress=lambda elapsed: pbar.update_absolute(min(99, int(elapsed / eta * 100))))
+    pbar.update_absolute(100)
+    return completed
+
+
+# ---------------------------------------------------------------------------
+# CDN 직접 요청
+# ---------------------------------------------------------------------------
+
+_HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                               "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
+_STREAM_CHUNK = 1 << 20
+_HTTP_POOL_SIZE = 8
+
+_http: requests.Session | None = None
+
+
+def _http_session() -> requests.Session:
+    """CDN 직접 요청용 keep-alive 세션 (커넥션 풀 공유)."""
+    global _http
+    if _http is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=_HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+        session.headers.update(_HTTP_HEADERS)
+        _http = session
+    return _http
+
+
+def _cdn_base(job: Job) -> str:
+    """job.cdn_url()에서 CDN 호스트 부분만 추출합니다 (예: https://cdn.midjourney.com)."""
+    return job.cdn_url(0).rsplit("/", 2)[0]
+
+
+def _http_get(url: str, content_type: str) -> bytes:
+    """url 응답 본문 전체. 예상한 미디어 타입이 아니면 실패."""
+    r = _http_session().get(url, timeout=30)
+    r.raise_for_status()
+    if not r.headers.get("Content-Type", "").startswith(content_type):
+        raise requests.RequestException(f"{url}: 예상하지 못한 응답 ({r.headers.get('Content-Type')})")
+    return r.content
+
+
+def _stream_to(url: str, path: Path, content_type: str) -> None:
+    """url 응답 본문을 청크 단위로 path에 기록합니다. 예상한 미디어 타입이 아니면 실패."""
+    with _http_session().get(url, stream=True, timeout=30) as r:
+        r.raise_for_status()
+        if not r.headers.get("Content-Type", "").startswith(content_type):
+            raise requests.RequestException(f"{url}: 예상하지 못한 응답 ({r.headers.get('Content-Type')})")
+        with open(path, "wb") as f:
+            for chunk in r.iter_content(_STREAM_CHUNK):
+                f.write(chunk)
 
 
 # ---------------------------------------------------------------------------
@@ -75,51 +581,353 @@ def poll_with_progress(
 # ---------------------------------------------------------------------------
 
 
+# 다운로드·디코드 워커 — 네트워크 대기와 PIL 디코드를 이미지별로 겹쳐 실행
+_DOWNLOAD_WORKERS = 8
+_download_pool = ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS, thread_name_prefix="mj-download")
+
+
+# 완료된 job 이미지의 원본 인코딩 바이트 캐시 (.env의 MJ_IMAGE_CACHE_MB로 용량 조정)
+_image_cache = DiskLRU(_USER_DIR / "cache" / "images",
+                       int(os.environ.get("MJ_IMAGE_CACHE_MB", "2048")) * 1024 * 1024)
+
+
+def _cache_name(job_id: str, *parts) -> str | None:
+    """job_id와 부가 키(index, size 등)로 만든 캐시 파일명. job_id가 파일명으로 안전하지 않으면 None."""
+    if not job_id or not all(ch.isalnum() or ch in "-_" for ch in job_id):
+        return None
+    return "_".join([job_id, *(str(p) for p in parts)])
+
+
+def _fetch_image_bytes(job: Job, index: int, size: int) -> bytes:
+    """이미지 1장의 원본 인코딩 바이트. 디스크 캐시에 없을 때만 CDN에서 받습니다.
+
+    완료된 MJ 결과는 바뀌지 않으므로 (job_id, index, size)로 영구 캐시합니다.
+    """
+    name = _cache_name(job.id, index, size or 0)
+    cached = _image_cache.get(name) if name else None
+    if cached is not None:
+        try:
+            return cached.read_bytes()
+        except OSError:
+            pass  # 읽기 직전에 축출됨 — 다시 받음
+    data = get_client(account_of(job.id)).download_images_bytes(job, size=size, indices=[index])[0]
+    if name:
+        _image_cache.put_bytes(name, data)
+    return data
+
+
+def _decode_rgb(data: bytes) -> np.ndarray:
+    """인코딩 바이트 → [H,W,3] uint8 배열 (float 변환 전 단계)."""
+    img = Image.open(BytesIO(data))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return np.asarray(img)
+
+
+def _load_image(job: Job, index: int, size: int) -> np.ndarray:
+    """이미지 1장 다운로드 + 디코드 → [H,W,3] uint8 배열."""
+    return _decode_rgb(_fetch_image_bytes(job, index, size))
+
+
+# 디코드된 IMAGE 텐서 메모리 캐시 — 노드 간·재실행 간 공유 (.env의 MJ_TENSOR_CACHE_MB로 용량 조정)
+_tensor_cache = TensorLRU(int(os.environ.get("MJ_TENSOR_CACHE_MB", "1024")) * 1024 * 1024)
+
+
+def _to_float_batch(arrays: list[np.ndarray | torch.Tensor]) -> torch.Tensor:
+    """같은 크기의 이미지들을 [N,H,W,C] float32 텐서 하나로 모읍니다.
+
+    출력 텐서를 한 번만 할당하고, uint8 배열은 해당 슬라이스에 직접 나눗셈 결과로,
+    캐시된 float 텐서는 그대로 복사해 기록합니다.
+    """
+    h, w, c = arrays[0].shape
+    out = torch.empty((len(arrays), h, w, c), dtype=torch.float32)
+    view = out.numpy()
+    for i, arr in enumerate(arrays):
+        if isinstance(arr, torch.Tensor):
+            out[i].copy_(arr)
+        else:
+            np.divide(arr, np.float32(255.0), out=view[i], casting="unsafe")
+    return out
+
+
+def _load_cached(job: Job, indices: list[int], size: int) -> list[torch.Tensor | Future]:
+    """인덱스별로 메모리 캐시의 [H,W,C] 텐서 또는 다운로드·디코드 Future를 반환합니다."""
+    items: list[torch.Tensor | Future] = []
+    for i in indices:
+        hit = _tensor_cache.get((job.id, i, size))
+        items.append(hit if hit is not None else _download_pool.submit(_load_image, job, i, size))
+    return items
+
+
+def _remember(job: Job, index: int, size: int, image: torch.Tensor) -> None:
+    # 캐시 항목은 출력 배치와 저장소를 공유하지 않도록 복사해 둠 (바이트 한도를 정확히 지키기 위해)
+    _tensor_cache.put((job.id, index, size), image.clone())
+
+
 def download_and_load_images(
     job: Job,
     indices: list[int] | None = None,
+    size: int = 1024,
 ) -> torch.Tensor:
-    """Job 이미지를 메모리에 다운로드하고 [N,H,W,C] float32 텐서를 반환합니다."""
-    client = get_client()
-    data_list = client.download_images_bytes(job, size=1024, indices=indices)
-    tensors: list[torch.Tensor] = []
-    for data in data_list:
-        img = Image.open(BytesIO(data)).convert("RGB")
-        arr = np.array(img, dtype=np.float32) / 255.0
-        tensors.append(torch.from_numpy(arr).unsqueeze(0))  # [1,H,W,C] 형태
-    return torch.cat(tensors, dim=0)  # [N,H,W,C] 형태
+    """Job 이미지를 [N,H,W,C] float32 텐서로 반환합니다.
+
+    메모리 캐시에 있는 이미지는 그대로 쓰고, 나머지만 동시에 다운로드·디코드합니다.
+    """
+    if indices is None:
+        indices = list(range(4))
+    items = _load_cached(job, indices, size)
+    if len(items) == 1 and isinstance(items[0], torch.Tensor):
+        # 캐시 항목의 뷰를 내보내면 하위 노드의 in-place 연산이 캐시를 오염시키므로 복사
+        return items[0].unsqueeze(0).clone()
+    arrays = [it.result() if isinstance(it, Future) else it for it in items]
+    if len({tuple(a.shape) for a in arrays}) > 1:
+        raise RuntimeError(f"Job {job.id}의 이미지 크기가 서로 달라 배치로 묶을 수 없습니다")
+    out = _to_float_batch(arrays)  # [N,H,W,C] 형태
+    for pos, (i, it) in enumerate(zip(indices, items)):
+        if isinstance(it, Future):
+            _remember(job, i, size, out[pos])
+    return out
 
 
 def try_download_all(
     job: Job,
+    size: int = 1024,
 ) -> list[torch.Tensor | None]:
-    """인덱스 0-3 다운로드를 시도합니다. 4개의 텐서 리스트를 반환하며, 실패 시 None입니다."""
+    """인덱스 0-3을 동시에 다운로드합니다. 4개의 텐서 리스트를 반환하며, 실패 시 None입니다."""
     results: list[torch.Tensor | None] = []
-    for i in range(4):
+    for i, it in enumerate(_load_cached(job, list(range(4)), size)):
+        if isinstance(it, torch.Tensor):
+            results.append(it.unsqueeze(0).clone())  # 캐시 항목과 저장소를 공유하지 않도록 복사
+            continue
         try:
-            t = download_and_load_images(job, indices=[i])
-            results.append(t)
+            t = _to_float_batch([it.result()])
         except Exception:
             results.append(None)
+            continue
+        _remember(job, i, size, t[0])
+        results.append(t)
     if not any(r is not None for r in results):
         raise RuntimeError(f"Job {job.id}에서 이미지를 찾을 수 없습니다")
     return results
 
 
-def video_bytes_to_video_input(data: bytes):
-    """Raw MP4 bytes → ComfyUI VideoInput (메모리 내, 디스크 I/O 없음)."""
+def _fetch_grid_bytes(job: Job) -> bytes:
+    """job의 2x2 그리드 이미지(grid_0.png) 원본 바이트. 디스크 캐시 우선."""
+    name = _cache_name(job.id, "grid", 0)
+    cached = _image_cache.get(name) if name else None
+    if cached is not None:
+        try:
+            return cached.read_bytes()
+        except OSError:
+            pass
+    data = _http_get(f"{_cdn_base(job)}/{job.id}/grid_0.png", "image/")
+    if name:
+        _image_cache.put_bytes(name, data)
+    return data
+
+
+def split_grid(grid: torch.Tensor) -> list[torch.Tensor]:
+    """[1,H,W,C] 그리드를 복사 없이 4개의 [1,H/2,W/2,C] 뷰로 나눕니다 (좌상·우상·좌하·우하)."""
+    h, w = grid.shape[1] // 2, grid.shape[2] // 2
+    return [grid[:, :h, :w], grid[:, :h, w:2 * w], grid[:, h:2 * h, :w], grid[:, h:2 * h, w:2 * w]]
+
+
+def download_grid_images(job: Job) -> tuple[list[torch.Tensor], torch.Tensor] | None:
+    """그리드 이미지 1장을 받아 (4개 이미지 뷰, 그리드 텐서)를 반환합니다. 그리드가 없으면 None.
+
+    반환하는 그리드는 캐시 항목과 저장소를 공유하지 않는 사본이며, 뷰는 그 사본을 나눈 것입니다.
+    """
+    key = (job.id, "grid", 0)
+    cached = _tensor_cache.get(key)
+    if cached is not None:
+        grid = cached.clone()
+    else:
+        try:
+            grid = _to_float_batch([_decode_rgb(_fetch_grid_bytes(job))])
+        except (requests.RequestException, OSError) as e:
+            print(f"[MJ] 그리드 다운로드 실패, 개별 이미지로 재시도: {e}")
+            return None
+        _tensor_cache.put(key, grid.clone())
+    return split_grid(grid), grid
+
+
+# ---------------------------------------------------------------------------
+# 여러 job 파이프라인 실행
+# ---------------------------------------------------------------------------
+
+_PIPELINE_WORKERS = 16
+
+
+def run_pipelined(
+    specs: list[dict],
+    size: int = 1024,
+    timeout: float = 600,
+) -> list[tuple[Job, torch.Tensor] | None]:
+    """여러 요청을 겹쳐서 서밋·폴링하고, 끝나는 job부터 바로 다운로드합니다.
+
+    specs: 각각 submit_job 인자(action, submit, mode, prompt, ...) dict.
+    서밋은 계정 슬롯 한도 안에서 동시에 진행되고 폴링은 공용 폴러가 함께 처리합니다.
+    결과는 specs 순서의 (완료 Job, [4,H,W,C] 텐서)이며 실패한 항목은 None입니다.
+    """
+    cancel = threading.Event()
+
+    def check_cancel() -> None:
+        if cancel.is_set():
+            raise CancelledError()
+
+    def run(spec: dict) -> tuple[Job, torch.Tensor]:
+        check_cancel()
+        job = submit_job(**spec, interrupt=check_cancel)
+        if not job.id:
+            raise RuntimeError("Job 제출 실패: API에서 빈 job ID가 반환되었습니다")
+        try:
+            completed = job_future(job, spec["action"], spec["mode"]).result(timeout=timeout)
+        except FutureTimeout:
+            raise _wait_timeout(job, timeout) from None
+        check_cancel()
+        return completed, download_and_load_images(completed, size=size)
+
+    if not specs:
+        return []
+    pbar = comfy.utils.ProgressBar(len(specs))
+    pool = ThreadPoolExecutor(max_workers=min(len(specs), _PIPELINE_WORKERS), thread_name_prefix="mj-pipeline")
+    futures = {pool.submit(run, spec): i for i, spec in enumerate(specs)}
+    results: list[tuple[Job, torch.Tensor] | None] = [None] * len(specs)
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for f in done:
+                i = futures[f]
+                try:
+                    results[i] = f.result()
+                except Exception as e:
+                    print(f"[MJ] {specs[i]['action']} #{i} 실패: {e}")
+                pbar.update(1)
+            comfy.model_management.throw_exception_if_processing_interrupted()
+    except BaseException:
+        # 아직 서밋 전인 요청은 서밋하지 않음 (이미 서밋된 job은 원장·폴러가 계속 추적)
+        cancel.set()
+        raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def concat_images(images: list[torch.Tensor]) -> torch.Tensor:
+    """[N,H,W,C] 텐서들을 하나의 배치로 합칩니다. 크기가 다르면 첫 텐서 크기로 맞춥니다."""
+    h, w = images[0].shape[1:3]
+    out = []
+    for t in images:
+        if t.shape[1:3] != (h, w):
+            t = comfy.utils.common_upscale(t.movedim(-1, 1), w, h, "bilinear", "center").movedim(1, -1)
+        out.append(t)
+    return torch.cat(out, dim=0)
+
+
+# ---------------------------------------------------------------------------
+# 비디오 헬퍼
+# ---------------------------------------------------------------------------
+
+# 완료된 비디오 변형 파일 캐시 (.env의 MJ_VIDEO_CACHE_MB로 용량 조정)
+_video_cache = DiskLRU(_USER_DIR / "cache" / "videos",
+                       int(os.environ.get("MJ_VIDEO_CACHE_MB", "4096")) * 1024 * 1024)
+
+
+def download_video_file(job_id: str, index: int = 0, size: int | None = None) -> Path:
+    """비디오 변형 하나를 디스크 캐시 파일로 받아 경로를 반환합니다.
+
+    원본 해상도는 해당 변형의 MP4만 청크 단위로 스트리밍합니다. 크기 지정이나 직접 요청이
+    실패한 경우에는 클라이언트로 필요한 변형까지 받은 뒤 선택한 변형만 저장합니다.
+    """
+    job = Job(id=job_id, prompt="")
+    name = _cache_name(job_id, index, size or 0)
+    if name:
+        cached = _video_cache.get(f"{name}.mp4")
+        if cached is not None:
+            return cached
+    else:
+        name = f"{hashlib.sha256(job_id.encode()).hexdigest()[:32]}_{index}_{size or 0}"
+
+    if size is None:
+        url = f"{_cdn_base(job)}/video/{job_id}/{index}.mp4"
+        try:
+            return _video_cache.put(f"{name}.mp4", lambda tmp: _stream_to(url, tmp, "video/"))
+        except (requests.RequestException, OSError) as e:
+            print(f"[MJ] 비디오 직접 다운로드 실패, 클라이언트로 재시도: {e}")
+
+    data = get_client(account_of(job_id)).download_video_bytes(job, size=size, batch_size=index + 1)[index]
+    return _video_cache.put_bytes(f"{name}.mp4", data)
+
+
+def decode_video_frames(path: Path, start: int = 0, end: int = -1, stride: int = 1) -> tuple[torch.Tensor, float]:
+    """MP4에서 [start, end] 구간의 stride 간격 프레임만 디코드해 ([N,H,W,C] float32, fps)를 반환합니다.
+
+    start 직전 키프레임으로 seek한 뒤 순차 디코드하며, 선택된 프레임만 uint8로 보관합니다.
+    end < 0이면 끝까지 디코드합니다.
+    """
+    import av
+
+    frames: list[np.ndarray] = []
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        fps = float(stream.average_rate or stream.guessed_rate or 24)
+        if start > 0 and stream.time_base:
+            container.seek(int(start / fps / stream.time_base), stream=stream, backward=True)
+        counter = None
+        for frame in container.decode(stream):
+            if frame.time is not None:
+                idx = round(frame.time * fps)
+            else:
+                # pts가 없으면 seek을 신뢰할 수 없으므로 처음부터 센다고 가정
+                counter = 0 if counter is None else counter + 1
+                idx = counter
+            if idx < start:
+                continue
+            if 0 <= end < idx:
+                break
+            if (idx - start) % stride == 0:
+                frames.append(frame.to_ndarray(format="rgb24"))
+    if not frames:
+        raise RuntimeError(f"{path.name}: 구간 [{start}, {end}]에 해당하는 프레임이 없습니다")
+    return _to_float_batch(frames), fps
+
+
+def video_file_to_video_input(path: Path):
+    """MP4 파일 경로 → ComfyUI VideoInput (디코드 시 디스크에서 읽음)."""
     from comfy_api.latest._input_impl.video_types import VideoFromFile
-    return VideoFromFile(BytesIO(data))
+    return VideoFromFile(str(path))
 
 
-def image_tensor_to_temp_file(image: torch.Tensor) -> str:
-    """단일 IMAGE 텐서 [1,H,W,C]를 임시 .png 파일 경로로 변환합니다."""
-    arr = (image.squeeze(0).cpu().numpy() * 255).clip(0, 255).astype(np.uint8)
-    img = Image.fromarray(arr)
-    fd, path = tempfile.mkstemp(suffix=".png", prefix="mj_img_")
-    os.close(fd)
-    img.save(path)
-    return path
+# ---------------------------------------------------------------------------
+# 이미지 입력 헬퍼
+# ---------------------------------------------------------------------------
+
+# 이미지 입력 PNG 저장소 — 텐서 내용 해시를 파일명으로 사용 (.env의 MJ_ASSET_CACHE_MB로 용량 조정)
+_ASSET_DIR = Path(tempfile.gettempdir()) / "comfyui_mj" / "assets"
+_assets = DiskLRU(_ASSET_DIR, int(os.environ.get("MJ_ASSET_CACHE_MB", "512")) * 1024 * 1024)
+
+
+def image_tensor_to_file(image: torch.Tensor) -> str:
+    """단일 IMAGE 텐서 [1,H,W,C]를 내용 주소 .png 파일 경로로 변환합니다.
+
+    같은 텐서는 PNG를 다시 인코딩하지 않고 같은 경로를 재사용합니다.
+    반환한 경로는 ComfyUI 출력 캐시(MJ_PARAMS 등)에 남아 나중 서밋에 쓰일 수 있으므로,
+    이번 세션 동안은 용량 한도를 넘어도 지우지 않습니다.
+    """
+    frame = image[0].detach().cpu().contiguous()
+    h = hashlib.blake2b(digest_size=20)
+    h.update(str((tuple(frame.shape), str(frame.dtype))).encode())
+    h.update(memoryview(frame.numpy()).cast("B"))
+    name = f"{h.hexdigest()}.png"
+
+    _assets.pin(name)
+    path = _assets.get(name)
+    if path is None:
+        arr = (frame.numpy() * 255).clip(0, 255).astype(np.uint8)
+        path = _assets.put(name, lambda tmp: Image.fromarray(arr).save(tmp, format="PNG"))
+    return str(path)
 
 
 # ---------------------------------------------------------------------------